@@ -27,8 +27,11 @@ class ScratchAgentEnvironment:
         ocr_server_url: str = "http://localhost:9090",
         documents_config: Optional[Dict[str, Any]] = None,
         use_element_list: bool = True,
+        http_session: Optional[requests.Session] = None,
     ):
         self.api_url = api_url
+        # Keep-alive connections to the API and OCR servers are reused across calls
+        self._http = http_session if http_session is not None else requests.Session()
         self.mode = str(mode).strip()
         if self.mode not in ("primitive", "composite"):
             raise ValueError(f"Invalid mode: {self.mode!r}. Expected 'primitive' or 'composite'.")
@@ -244,7 +247,7 @@ class ScratchAgentEnvironment:
                 'confidence': str(confidence)
             }
             
-            response = requests.post(
+            response = self._http.post(
                 f"{self.ocr_server_url}/ocr/detect", 
                 files=files, 
                 data=data,
@@ -780,7 +783,7 @@ class ScratchAgentEnvironment:
         params: Optional[Dict[str, Any]] = None,
         timeout: Optional[float] = 60,
     ):
-        return requests.get(self._url(route), params=params, timeout=timeout)
+        return self._http.get(self._url(route), params=params, timeout=timeout)
 
     def _post(
         self,
@@ -789,7 +792,7 @@ class ScratchAgentEnvironment:
         json: Optional[Dict[str, Any]] = None,
         timeout: Optional[float] = None,
     ):
-        return requests.post(self._url(route), json=json, timeout=timeout)
+        return self._http.post(self._url(route), json=json, timeout=timeout)
 
     def get_documentation(self) -> Dict[str, Any]:
         """
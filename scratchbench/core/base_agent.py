@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, Any, Optional
 
 
@@ -27,6 +28,9 @@ class BaseAgent(ABC):
     不管理环境交互，环境交互由 TaskRunner 协调。
     """
     
+    # predict 是否可以在后台线程中执行；只有确认线程安全的子类才应设为 True
+    supports_async_predict: bool = False
+    
     @abstractmethod
     def initialize(self, task_description: str, documentation: Dict[str, Any]) -> None:
         """
@@ -64,4 +68,41 @@ class BaseAgent(ABC):
         Raises:
             AgentPredictionException: 当LLM API调用失败时抛出，提前终止交互循环
         """
-        pass
\ No newline at end of file
+        pass
+
+    def predict_async(self, observation: Dict[str, Any], turn: int = 0) -> Future:
+        """
+        在后台线程中执行 predict，立即返回 Future
+        
+        调用方可以在等待 LLM 响应的同时处理其他工作（如保存截图）。
+        每个 Agent 只使用一个工作线程，保证各轮预测按提交顺序执行。
+        supports_async_predict 为 False 时在当前线程同步执行 predict，
+        返回已完成的 Future。
+        
+        Args:
+            observation: 环境观察，同 predict
+            turn: 当前交互轮次，从0开始
+            
+        Returns:
+            Future，其 result() 返回 predict 的结果，或重新抛出 predict 的异常
+            （如 AgentPredictionException）
+        """
+        if not self.supports_async_predict:
+            future: Future = Future()
+            try:
+                future.set_result(self.predict(observation, turn))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        executor = getattr(self, "_predict_executor", None)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-predict")
+            self._predict_executor = executor
+        return executor.submit(self.predict, observation, turn)
+
+    def shutdown_predict_executor(self) -> None:
+        """等待未完成的 predict_async 调用结束，并释放其后台线程"""
+        executor = getattr(self, "_predict_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=True)
+            self._predict_executor = None
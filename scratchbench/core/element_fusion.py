@@ -2,10 +2,48 @@
 Element fusion utilities for combining DOM and OCR elements
 """
 import logging
+import sys
 from typing import List, Dict, Any, Tuple, Optional
 import re
 
+import numpy as np
+
 logger = logging.getLogger("scratch_bench.element_fusion")
+
+# Interned so that equality checks against element fields interned below
+# short-circuit on identity
+_SOURCE_DOM = sys.intern('dom')
+_SOURCE_OCR = sys.intern('ocr')
+_TYPE_TEXT = sys.intern('text')
+_TYPE_CANVAS = sys.intern('canvas')
+
+_INTERACTABLE_TYPES = frozenset(sys.intern(t) for t in (
+    'clickable', 'green_flag', 'stop_button', 'inputs',
+    'sprites', 'blocks', 'flyout_buttons', 'category_menu_item'
+))
+
+# Marker in a DOM block name for blocks placed on the code canvas
+_ON_CANVAS = 'on canvas'
+
+# Raw DOM fields that are not copied through verbatim: the coordinates are
+# folded into 'bbox' and 'type' is stored interned
+_DOM_NORMALIZED_FIELDS = frozenset(('x', 'y', 'width', 'height', 'type'))
+
+
+class _OcrCandidate:
+    """Lightweight record for an OCR element that passed the confidence filter.
+
+    The full unified dict is only built for candidates that survive the coverage scan.
+    """
+    __slots__ = ('id', 'box', 'text', 'element')
+
+    def __init__(self, id: str, box: Tuple[int, int, int, int], text: str, element: Dict[str, Any]):
+        self.id = id
+        self.box = box
+        self.text = text
+        self.element = element
+
+
 class ElementFusion:
     """
     Handles fusion of DOM and OCR elements with fine-grained control over OCR hiding
@@ -47,156 +85,171 @@ class ElementFusion:
         normalized_dom = self._normalize_dom_elements(dom_elements)
         normalized_ocr = self._normalize_ocr_elements(ocr_elements)
         
-        # Find OCR elements covered by DOM elements with fine-grained control
-        covered_ocr_indices = set()
+        # Only DOM elements that may hide OCR take part in the coverage scan:
+        # the canvas itself never does, and "on canvas" elements only when the switch is on
+        hide_on_canvas = self.hide_covered_ocr_on_canvas
+        active_dom = [
+            dom_element for dom_element in normalized_dom
+            if dom_element.get("type") != _TYPE_CANVAS
+            and (hide_on_canvas or not self._is_on_canvas(dom_element))
+        ]
         
-        for dom_element in normalized_dom:
-            if dom_element.get("type", "") == "canvas":
-                continue
-            has_on_canvas = dom_element.get('block_name', '').find('on canvas') != -1
-            
-            # Determine whether to hide covered OCR elements for this DOM element
-            should_hide_covered = True  # Default: always hide for non-"on canvas" elements
-            if has_on_canvas:
-                # For "on canvas" elements, use the switch
-                should_hide_covered = self.hide_covered_ocr_on_canvas
+        # Find OCR elements covered by DOM elements with fine-grained control
+        covered_any = np.zeros(len(normalized_ocr), dtype=bool)
+        if active_dom and normalized_ocr:
+            dom_boxes = np.array([self._bbox_tuple(dom_element['bbox']) for dom_element in active_dom],
+                                 dtype=np.float64)
+            ocr_boxes = np.array([candidate.box for candidate in normalized_ocr], dtype=np.float64)
+            cover_matrix = self._compute_cover_matrix(dom_boxes, ocr_boxes)
+            covered_any = cover_matrix.any(axis=0)
             
-            if should_hide_covered:
-                # Find all OCR elements covered by this DOM element
-                covered_ocr = self._find_covered_ocr_elements(dom_element, normalized_ocr, covered_ocr_indices)
-                
-                # Mark these OCR elements as covered (to be removed)
-                for ocr_idx in covered_ocr:
-                    covered_ocr_indices.add(ocr_idx)
-                
-                if covered_ocr:
-                    ocr_texts = [normalized_ocr[i]['text'] for i in covered_ocr]
-                    canvas_status = "on canvas" if has_on_canvas else "regular"
-                    logger.debug(f"DOM element {dom_element.get('type', 'unknown')} ({canvas_status}) covers {len(covered_ocr)} OCR elements: {ocr_texts}")
+            if logger.isEnabledFor(logging.DEBUG):
+                self._log_covered_ocr(active_dom, normalized_ocr, cover_matrix, covered_any)
         
-        # Add uncovered OCR elements as text-only elements
-        uncovered_ocr = [
-            self._ocr_to_text_element(normalized_ocr[i]) 
-            for i in range(len(normalized_ocr)) 
-            if i not in covered_ocr_indices
-        ]
-        
-        # Combine: DOM elements first (unchanged), then uncovered OCR elements
-        result = normalized_dom + uncovered_ocr
+        uncovered_idx = np.flatnonzero(~covered_any).tolist()
+        covered_count = len(normalized_ocr) - len(uncovered_idx)
         
         # Log fusion statistics
         self._log_fusion_stats(len(normalized_dom), len(normalized_ocr), 
-                             len(covered_ocr_indices), len(uncovered_ocr))
+                             covered_count, len(uncovered_idx))
+        
+        if not uncovered_idx:
+            return normalized_dom
         
-        return result
+        # Combine: DOM elements first (unchanged), then uncovered OCR elements as text-only elements
+        to_text_element = self._ocr_to_text_element
+        return normalized_dom + [to_text_element(normalized_ocr[i]) for i in uncovered_idx]
     
     def _normalize_dom_elements(self, dom_elements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Normalize DOM elements to unified structure"""
         normalized = []
+        append = normalized.append
         for element in dom_elements:
-            normalized.append({
-                'id': element.get('id', ''),
-                'source': 'dom',
+            get = element.get
+            position = get("position")
+            element_type = get('type', 'unknown')
+            if isinstance(element_type, str):
+                element_type = sys.intern(element_type)
+            base = {
+                'id': get('id', ''),
+                'source': _SOURCE_DOM,
                 'bbox': {
-                    'x': element.get("position").get('x', 0),
-                    'y': element.get("position").get('y', 0),
-                    'width': element.get("position").get('width', 0),
-                    'height': element.get("position").get('height', 0)
+                    'x': position.get('x', 0),
+                    'y': position.get('y', 0),
+                    'width': position.get('width', 0),
+                    'height': position.get('height', 0)
                 },
-                'text': element.get('text', '').strip(),
-                'type': element.get('type', 'unknown'),
-                'interactable': self._is_interactable_type(element.get('type', '')),
+                'text': get('text', '').strip(),
+                'type': element_type,
+                'interactable': element_type in _INTERACTABLE_TYPES,
                 'confidences': {
                     'dom_conf': 1.0,
                     'ocr_conf': 0.0,
                     'merged_conf': 1.0
                 },
                 'dom_metadata': {
-                    'selector': element.get('selector', ''),
-                    'tag_name': element.get('tag_name', ''),
-                    'attributes': element.get('attributes', {}),
-                    'visible': element.get('visible', True)
+                    'selector': get('selector', ''),
+                    'tag_name': get('tag_name', ''),
+                    'attributes': get('attributes', {}),
+                    'visible': get('visible', True)
                 },
                 'ocr_metadata': None,
-                # Preserve all original DOM fields
-                **{k: v for k, v in element.items() if k not in ['x', 'y', 'width', 'height']}
-            })
+            }
+            # Preserve all original DOM fields
+            base.update({k: v for k, v in element.items() if k not in _DOM_NORMALIZED_FIELDS})
+            append(base)
         return normalized
     
-    def _normalize_ocr_elements(self, ocr_elements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Normalize OCR elements to unified structure"""
+    def _normalize_ocr_elements(self, ocr_elements: List[Dict[str, Any]]) -> List[_OcrCandidate]:
+        """Filter OCR elements by confidence into lightweight candidates"""
         normalized = []
         for element in ocr_elements:
             if element.get('confidence', 0) >= self.ocr_min_confidence:
-                normalized.append({
-                    'id': f"ocr_{len(normalized)}",
-                    'source': 'ocr',
-                    'bbox': {
-                        'x': element.get('x', 0),
-                        'y': element.get('y', 0),
-                        'width': element.get('width', 0),
-                        'height': element.get('height', 0)
-                    },
-                    'text': element.get('text', '').strip(),
-                    'type': element.get('element_type', 'text'),
-                    'interactable': False,  # OCR elements are not directly interactable
-                    'confidences': {
-                        'dom_conf': 0.0,
-                        'ocr_conf': element.get('confidence', 0.0),
-                        'merged_conf': element.get('confidence', 0.0)
-                    },
-                    'dom_metadata': None,
-                    'ocr_metadata': {
-                        'raw_text': element.get('text', ''),
-                        'confidence': element.get('confidence', 0.0)
-                    }
-                })
+                x = element.get('x', 0)
+                y = element.get('y', 0)
+                normalized.append(_OcrCandidate(
+                    f"ocr_{len(normalized)}",
+                    (x, y, x + element.get('width', 0), y + element.get('height', 0)),
+                    element.get('text', '').strip(),
+                    element,
+                ))
         return normalized
     
-    def _ocr_to_text_element(self, ocr_element: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert OCR element to text-only element"""
-        element = ocr_element.copy()
-        element['type'] = 'text'  # Override type for unmatched OCR
-        element['interactable'] = False
-        return element
+    def _ocr_to_text_element(self, candidate: _OcrCandidate) -> Dict[str, Any]:
+        """Convert an OCR candidate to a unified text-only element"""
+        element = candidate.element
+        return {
+            'id': candidate.id,
+            'source': _SOURCE_OCR,
+            'bbox': {
+                'x': element.get('x', 0),
+                'y': element.get('y', 0),
+                'width': element.get('width', 0),
+                'height': element.get('height', 0)
+            },
+            'text': candidate.text,
+            'type': _TYPE_TEXT,  # Unmatched OCR is always exposed as plain text
+            'interactable': False,  # OCR elements are not directly interactable
+            'confidences': {
+                'dom_conf': 0.0,
+                'ocr_conf': element.get('confidence', 0.0),
+                'merged_conf': element.get('confidence', 0.0)
+            },
+            'dom_metadata': None,
+            'ocr_metadata': {
+                'raw_text': element.get('text', ''),
+                'confidence': element.get('confidence', 0.0)
+            }
+        }
     
-    def _find_covered_ocr_elements(self, dom_element: Dict[str, Any], ocr_elements: List[Dict[str, Any]], 
-                                 already_covered: set) -> List[int]:
-        """Find OCR elements that are covered by the DOM element's bounding box"""
-        covered_indices = []
-        dom_bbox = dom_element['bbox']
+    @staticmethod
+    def _compute_cover_matrix(dom_boxes: np.ndarray, ocr_boxes: np.ndarray) -> np.ndarray:
+        """
+        Compute which OCR boxes are completely covered by which DOM boxes
         
-        for i, ocr_element in enumerate(ocr_elements):
-            # Skip if already covered by another DOM element
-            if i in already_covered:
-                continue
-                
-            ocr_bbox = ocr_element['bbox']
+        Args:
+            dom_boxes: (N, 4) array of DOM boxes as (x1, y1, x2, y2)
+            ocr_boxes: (K, 4) array of OCR boxes as (x1, y1, x2, y2)
             
-            # Check if OCR element is completely covered by DOM element
-            if self._bbox_covers(dom_bbox, ocr_bbox):
-                covered_indices.append(i)
-        
-        return covered_indices
+        Returns:
+            (N, K) boolean array, True where DOM box n covers OCR box k
+        """
+        outer = dom_boxes[:, None, :]
+        inner = ocr_boxes[None, :, :]
+        return ((outer[..., 0] <= inner[..., 0]) &
+                (outer[..., 1] <= inner[..., 1]) &
+                (outer[..., 2] >= inner[..., 2]) &
+                (outer[..., 3] >= inner[..., 3]))
     
-    def _bbox_covers(self, outer_bbox: Dict[str, int], inner_bbox: Dict[str, int]) -> bool:
-        """Check if outer_bbox completely covers inner_bbox"""
-        return (outer_bbox['x'] <= inner_bbox['x'] and
-                outer_bbox['y'] <= inner_bbox['y'] and
-                outer_bbox['x'] + outer_bbox['width'] >= inner_bbox['x'] + inner_bbox['width'] and
-                outer_bbox['y'] + outer_bbox['height'] >= inner_bbox['y'] + inner_bbox['height'])
+    @staticmethod
+    def _bbox_tuple(bbox: Dict[str, int]) -> Tuple[int, int, int, int]:
+        """Convert a bbox dict into an (x1, y1, x2, y2) corner tuple"""
+        x = bbox['x']
+        y = bbox['y']
+        return (x, y, x + bbox['width'], y + bbox['height'])
     
+    @staticmethod
+    def _is_on_canvas(dom_element: Dict[str, Any]) -> bool:
+        """Check if a DOM element is a block placed on the code canvas"""
+        block_name = dom_element.get('block_name')
+        return block_name is not None and _ON_CANVAS in block_name
     
-    def _is_interactable_type(self, element_type: str) -> bool:
-        """Check if element type is interactable"""
-        interactable_types = {
-            'clickable', 'green_flag', 'stop_button', 'inputs', 
-            'sprites', 'blocks', 'flyout_buttons', 'category_menu_item'
-        }
-        return element_type in interactable_types
+    def _log_covered_ocr(self, active_dom: List[Dict[str, Any]], normalized_ocr: List[_OcrCandidate],
+                         cover_matrix: np.ndarray, covered_any: np.ndarray):
+        """Debug-log which OCR elements each DOM element hides"""
+        # Attribute each covered OCR element to the first DOM element covering it
+        first_cover = cover_matrix.argmax(axis=0)
+        for dom_idx in np.unique(first_cover[covered_any]).tolist():
+            dom_element = active_dom[dom_idx]
+            covered_ocr = np.flatnonzero(covered_any & (first_cover == dom_idx)).tolist()
+            ocr_texts = [normalized_ocr[i].text for i in covered_ocr]
+            canvas_status = "on canvas" if self._is_on_canvas(dom_element) else "regular"
+            logger.debug(f"DOM element {dom_element.get('type', 'unknown')} ({canvas_status}) covers {len(covered_ocr)} OCR elements: {ocr_texts}")
     
     def _log_fusion_stats(self, dom_count: int, ocr_count: int, matched_count: int, unmatched_ocr_count: int):
         """Log fusion statistics"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         total_result = dom_count + unmatched_ocr_count
         logger.info(f"Element fusion: {dom_count} DOM + {ocr_count} OCR → {total_result} total "
                    f"({matched_count} merged, {unmatched_ocr_count} OCR-only)")
@@ -2,12 +2,16 @@
 # -*- coding: utf-8 -*-
 
 import base64
+import copy
+import hashlib
 import json
 import os
 import re
+import struct
 import time
 import random
 
+from collections import OrderedDict
 from datetime import datetime
 from typing import Optional, Dict, Any
 from io import BytesIO
@@ -35,6 +39,14 @@ import jsonschema
 
 logger = logging.getLogger("scratch_bench.llm_agent")
 
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Signature (8 bytes) + IHDR chunk (25 bytes) = 33 bytes = 44 base64 characters
+_PNG_HEADER_B64_LEN = 44
+# Maximum number of cached action plans kept when enable_action_cache is on
+_ACTION_CACHE_SIZE = 64
+# Base64 prefix (48 KiB decoded) handed to PIL when probing non-PNG screenshots
+_FALLBACK_HEADER_B64_LEN = 65536
+
 
 class ScratchAgent(BaseAgent):
     """
@@ -42,6 +54,10 @@ class ScratchAgent(BaseAgent):
     Can connect to OpenAI or other LLM services to automatically control Scratch.
     """
     
+    # predict only touches this agent's own state and the thread-safe LLMCallManager,
+    # and the runner never calls into the agent while a prediction is pending
+    supports_async_predict = True
+    
     def __init__(self, 
                  llm_api_key=None, 
                  model="gpt-4-vision-preview",
@@ -51,7 +67,8 @@ class ScratchAgent(BaseAgent):
                  cost_log_path="cost.json",
                  mode: str = "primitive",  # "primitive" | "composite"
                  use_last_screenshot: bool = False,
-                 use_element_list: bool = True):
+                 use_element_list: bool = True,
+                 enable_action_cache: bool = False):
         """
         Initialize the LLM Agent
         
@@ -65,6 +82,8 @@ class ScratchAgent(BaseAgent):
         - mode: Agent mode ("primitive" | "composite")
         - use_last_screenshot: Whether to only keep the latest screenshot in the request to the LLM
         - use_element_list: Whether to provide element list in primitive mode
+        - enable_action_cache: Whether to reuse the action plan of an identical earlier turn
+          (same prompt and screenshot) instead of calling the LLM; meant for deterministic replay
         """
         # Support multiple environment variable names
         self.llm_api_key = (llm_api_key or
@@ -85,6 +104,9 @@ class ScratchAgent(BaseAgent):
         self.use_last_screenshot: bool = bool(use_last_screenshot)
         self.use_element_list: bool = bool(use_element_list)
         self.max_turns: int = 10
+        self.enable_action_cache: bool = bool(enable_action_cache)
+        # LRU of (assistant content, action plan) keyed by a digest of the turn's prompt + screenshot
+        self._action_cache: "OrderedDict[str, Tuple[str, Optional[Dict[str, Any]]]]" = OrderedDict()
         # Lazy-initialized LLM client (OpenAI-compatible, supports custom base_url)
         self._client = OpenAI(base_url=self.base_url, api_key=self.llm_api_key)
         
@@ -97,6 +119,8 @@ class ScratchAgent(BaseAgent):
         
         # cache latest observation to avoid redundant environment calls
         self._last_observation: Optional[Dict[str, Any]] = None
+        # screenshot sizes keyed by the base64 PNG header (window size is stable per session)
+        self._screen_dims_cache: Dict[str, Tuple[int, int]] = {}
 
         # Load documentation - this will be initialized in initialize() method
         self._documentation: Optional[Dict[str, Any]] = None
@@ -159,6 +183,47 @@ class ScratchAgent(BaseAgent):
                     "content": system_prompt_primitive_withou_element_list(task_description, actions_catalog=actions_catalog)
                 })
         
+    def _get_screen_size(self, image_b64: str) -> Tuple[int, int]:
+        """
+        Return (width, height) of a base64 screenshot, caching PNG sizes by header.
+
+        The PNG signature and IHDR chunk (which holds the dimensions) fill the first
+        33 bytes, i.e. the first 44 base64 characters, so equal prefixes imply equal sizes.
+        """
+        header_key = image_b64[:_PNG_HEADER_B64_LEN]
+        cached = self._screen_dims_cache.get(header_key)
+        if cached is not None:
+            return cached
+
+        # PNG: read width/height straight from the IHDR chunk without decoding the image
+        header = base64.b64decode(header_key)
+        if header.startswith(_PNG_SIGNATURE) and header[12:16] == b"IHDR":
+            size = struct.unpack(">II", header[16:24])
+            self._screen_dims_cache[header_key] = size
+            return size
+
+        # Other formats: PIL only parses the header to report the size, so try a
+        # bounded prefix of the data before decoding the whole screenshot
+        if len(image_b64) > _FALLBACK_HEADER_B64_LEN:
+            try:
+                with Image.open(BytesIO(base64.b64decode(image_b64[:_FALLBACK_HEADER_B64_LEN]))) as img:
+                    return img.size
+            except (OSError, SyntaxError, ValueError):
+                pass
+        with Image.open(BytesIO(base64.b64decode(image_b64))) as img:
+            return img.size
+
+    def _trim_conversation_history(self) -> None:
+        """
+        Drop history entries that can no longer reach the LLM.
+
+        predict() only sends the system prompt plus the last ``max_turns`` exchanges,
+        so older entries are discarded in place to keep per-turn work and memory bounded.
+        """
+        max_history_msgs = self.max_turns * 2
+        if len(self.conversation_history) > max_history_msgs + 1:
+            del self.conversation_history[1:-max_history_msgs]
+
     def _save_turn_log_clean(self, turn, messages, response=None, cost=None):
         """
         Save the full turn log information (prompt, elements, assistant response, optional reasoning, and raw API response)
@@ -221,6 +286,7 @@ class ScratchAgent(BaseAgent):
         """
         # Prepare image data
         image_b64 = observation.get("screenshot", "")
+        prompt = ""
         
         # Build prompt depending on mode
         if self.mode == "composite":
@@ -262,30 +328,39 @@ class ScratchAgent(BaseAgent):
                 "content": content_list
             })
         
-        # Prepare messages (optionally filter earlier screenshots)
+        # Prepare messages. With use_last_screenshot, earlier user messages are already
+        # stored text-only (see below), so only the current one carries a screenshot.
         messages = list(self.conversation_history)
-        
-        if self.mode != "composite" and self.use_last_screenshot:
-            last_user_idx = len(messages) - 1
-            filtered = []
-            for i, m in enumerate(messages):
-                if isinstance(m, dict) and m.get("role") == "user" and isinstance(m.get("content"), list):
-                    if i != last_user_idx:
-                        # Keep only text parts for earlier user messages
-                        filtered.append({"role": "user", "content": [p for p in m["content"] if isinstance(p, dict) and p.get("type") == "text"]})
-                    else:
-                        filtered.append(m)
-                else:
-                    filtered.append(m)
-            messages = filtered
 
         # Global truncation: Keep system message + recent turns + latest user message
         max_recent_msgs = self.max_turns * 2 + 1
         if len(messages) > max_recent_msgs + 1:
             messages = messages[:1] + messages[-max_recent_msgs:]
 
-        self._save_turn_log_clean(turn, messages)
-        
+        # Earlier screenshots are never sent again, so drop them from the stored
+        # history now (the `messages` list keeps the original entry for this call)
+        if self.mode != "composite" and self.use_last_screenshot:
+            current_user = self.conversation_history[-1]
+            self.conversation_history[-1] = {
+                "role": "user",
+                "content": [p for p in current_user["content"] if isinstance(p, dict) and p.get("type") == "text"]
+            }
+
+        action_cache_key = None
+        if self.enable_action_cache:
+            action_cache_key = hashlib.blake2b(
+                (prompt + image_b64).encode("utf-8"), digest_size=16
+            ).hexdigest()
+            cached = self._action_cache.get(action_cache_key)
+            if cached is not None:
+                self._action_cache.move_to_end(action_cache_key)
+                content, action_plan = cached
+                self.conversation_history.append({"role": "assistant", "content": content})
+                self._trim_conversation_history()
+                self._save_turn_log_clean(turn, messages, {"cached": True, "content": content})
+                logger.info(f"Reusing cached action plan: {action_plan}")
+                return copy.deepcopy(action_plan)
+
         # Call the LLM using the manager
         try:
             llm_response = self.llm_call_manager.call(
@@ -306,6 +381,7 @@ class ScratchAgent(BaseAgent):
             if reasoning_content is not None:
                 history_entry["reasoning_content"] = reasoning_content
             self.conversation_history.append(history_entry)
+            self._trim_conversation_history()
             
             logger.info("\n LLM response:" + content)
 
@@ -322,9 +398,7 @@ class ScratchAgent(BaseAgent):
                 screen_width, screen_height = 1280, 720  # Default fallback
                 if image_b64:
                     try:
-                        img_data = base64.b64decode(image_b64)
-                        with Image.open(BytesIO(img_data)) as img:
-                            screen_width, screen_height = img.size
+                        screen_width, screen_height = self._get_screen_size(image_b64)
                     except Exception as e:
                         logger.warning(f"Failed to get image size from screenshot: {e}")
                 
@@ -339,9 +413,16 @@ class ScratchAgent(BaseAgent):
                 if str(action_plan) != original_plan:
                     logger.info(f"Resized action plan: {action_plan}")
             
+            if action_cache_key is not None and action_plan:
+                self._action_cache[action_cache_key] = (content, copy.deepcopy(action_plan))
+                if len(self._action_cache) > _ACTION_CACHE_SIZE:
+                    self._action_cache.popitem(last=False)
+            
             return action_plan
             
         except LLMCallException as e:
             logger.error(f"LLM call failed for turn {turn}: {e}")
+            # Keep the prompt of the failed turn on disk for debugging
+            self._save_turn_log_clean(turn, messages)
             # Re-raise as AgentPredictionException to signal fatal error
             raise AgentPredictionException(f"LLM API call failed: {e}") from e
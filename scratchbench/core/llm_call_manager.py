@@ -7,20 +7,79 @@ A comprehensive utility for managing LLM API calls with logging, retry logic,
 and rate limiting.
 """
 
+import atexit
+import copy
+import hashlib
+import itertools
 import json
 import os
 import time
 import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional
 from pathlib import Path
 import logging
 
-from openai import OpenAI
+import httpx
+from openai import DefaultHttpxClient, OpenAI
 
 logger = logging.getLogger("scratch_bench.llm_call_manager")
 
 
+# Process-wide HTTP clients keyed by base_url, so managers talking to the same
+# endpoint reuse pooled keep-alive connections instead of re-handshaking
+_HTTPX_CLIENTS: Dict[str, httpx.Client] = {}
+_HTTPX_CLIENTS_LOCK = threading.Lock()
+# Last time (time.monotonic) each shared pool was used or warmed
+_POOL_LAST_USED: Dict[str, float] = {}
+# Pooled connections idle longer than this may have been dropped (keep-alive expiry minus margin)
+_POOL_WARM_SECONDS = 70.0
+
+
+class _TokenBucket:
+    """
+    Adaptive token bucket pacing requests under a requests-per-minute limit.
+
+    Tokens refill at ``rate`` per second up to ``capacity``. The rate is halved when the
+    provider signals overload (429/5xx) and recovers additively on success, never
+    exceeding the configured limit nor dropping below a tenth of it. A caller that has
+    to wait is additionally held for ``buffer`` seconds as a safety margin.
+    """
+
+    def __init__(self, rate_limit_rpm: float, burst: float = 1.0, buffer: float = 0.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_rate = rate_limit_rpm / 60.0
+        self.rate = self.max_rate
+        self.min_rate = self.max_rate / 10.0
+        self.increase_step = self.max_rate / 10.0
+        self.capacity = max(1.0, burst)
+        self.tokens = self.capacity
+        self.buffer = buffer
+        self._clock = clock
+        self.last_refill = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Reserve one token and return how many seconds the caller must wait for it."""
+        with self._lock:
+            now = self._clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1.0
+            return -self.tokens / self.rate + self.buffer if self.tokens < 0 else 0.0
+
+    def decrease_rate(self) -> None:
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2.0)
+
+    def increase_rate(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+
 class LLMCallException(Exception):
     """Exception raised when LLM API calls fail after all retries."""
     pass
@@ -54,7 +113,12 @@ class LLMCallManager:
         max_delay: float = 10.0,
         jitter: float = 0.2,
         rate_limit_rpm: Optional[float] = None,
-        session_id: Optional[str] = None
+        rate_limit_buffer: float = 3.0,
+        session_id: Optional[str] = None,
+        enable_cache: bool = False,
+        cache_max_entries: int = 512,
+        http_client: Optional[httpx.Client] = None,
+        warmup: bool = False
     ):
         """
         Initialize the LLM Call Manager.
@@ -69,16 +133,41 @@ class LLMCallManager:
             backoff_factor: Multiplier for backoff delay
             max_delay: Maximum delay cap
             jitter: Random jitter to add to delays
-            rate_limit_rpm: Rate limit in requests per minute
+            rate_limit_rpm: Rate limit in requests per minute. Calls are paced start-to-start
+                by a token bucket shared by concurrent callers; the pace halves on 429/5xx
+                responses and recovers gradually on success, never exceeding this limit.
+            rate_limit_buffer: Extra seconds added to every rate-limit wait (default 3s,
+                the margin earlier versions always applied)
             session_id: Optional session identifier for logging
+            enable_cache: Reuse responses of identical earlier requests (same model,
+                messages, temperature, max_tokens and extra kwargs) instead of calling the API.
+                Only applies to deterministic requests (temperature unset or 0).
+            cache_max_entries: Maximum number of cached responses (LRU eviction)
+            http_client: Optional pre-configured httpx client (custom transport, connection
+                limits, proxies) used by the OpenAI SDK. Defaults to a connection pool
+                shared by all managers with the same base_url.
+            warmup: Opt in to opening a connection to the endpoint in the background so the
+                first call skips the DNS/TCP/TLS handshake (issues a models.retrieve request).
+                Skipped when a custom http_client is given, rate limiting is configured or
+                the shared pool for base_url was used recently.
         """
         # Get configuration from environment if not provided
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY") or os.environ.get("LLM_API_KEY")
         self.base_url = base_url or os.environ.get("LLM_BASE_URL", "https://api.openai.com/v1")
         self.model = model
         
+        # The model never changes after construction, so resolve its family once
+        model_name = (self.model or "").lower()
+        self._is_gemini = "gemini" in model_name
+        self._is_claude = "claude" in model_name
+        self._use_responses = model_name.startswith(self.RESPONSES_MODEL_PREFIXES)
+        self._thinking_extra_body = self._build_thinking_extra_body()
+        
         # Initialize OpenAI client
-        self.client = OpenAI(base_url=self.base_url, api_key=self.api_key)
+        shared_pool = http_client is None
+        if shared_pool:
+            http_client = self._shared_http_client(self.base_url)
+        self.client = OpenAI(base_url=self.base_url, api_key=self.api_key, http_client=http_client)
         
         self.timeout = timeout
         self.max_retries = max_retries
@@ -93,62 +182,116 @@ class LLMCallManager:
             env_rpm = os.environ.get("RATE_LIMIT_RPM")
             self.rate_limit_rpm = float(env_rpm) if env_rpm else None
         
+        self._rate_limiter: Optional[_TokenBucket] = None
         if self.rate_limit_rpm:
             logger.info(f"Rate limit configured: {self.rate_limit_rpm} RPM")
+            if self.rate_limit_rpm > 0:
+                self._rate_limiter = _TokenBucket(self.rate_limit_rpm, buffer=rate_limit_buffer)
+        
+        if warmup and shared_pool and not self.rate_limit_rpm and self._claim_warmup(self.base_url):
+            threading.Thread(target=self._warmup, name="llm-warmup", daemon=True).start()
         
         self.session_id = session_id or datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Track call history
+        # Track call history; itertools.count hands out numbers atomically, so
+        # concurrent call() threads (see call_many) never share a call_id
+        self._call_counter = itertools.count(1)
         self.call_count = 0
         self.last_call_time: Optional[float] = None
+        
+        # Exact-match response cache
+        self.enable_cache = enable_cache
+        self.cache_max_entries = cache_max_entries
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
     
+    @staticmethod
+    def _shared_http_client(base_url: str) -> httpx.Client:
+        """Return the process-wide pooled HTTP client for base_url, creating it on first use."""
+        with _HTTPX_CLIENTS_LOCK:
+            client = _HTTPX_CLIENTS.get(base_url)
+            if client is None:
+                client = DefaultHttpxClient(
+                    limits=httpx.Limits(max_keepalive_connections=64, max_connections=128, keepalive_expiry=85)
+                )
+                _HTTPX_CLIENTS[base_url] = client
+            return client
+
+    @staticmethod
+    def shutdown_pools() -> None:
+        """Close all shared HTTP clients (registered to run at interpreter exit)."""
+        with _HTTPX_CLIENTS_LOCK:
+            for client in _HTTPX_CLIENTS.values():
+                client.close()
+            _HTTPX_CLIENTS.clear()
+
+    @staticmethod
+    def _claim_warmup(base_url: str) -> bool:
+        """Return True if the shared pool for base_url is cold and mark it as being warmed."""
+        now = time.monotonic()
+        with _HTTPX_CLIENTS_LOCK:
+            last_used = _POOL_LAST_USED.get(base_url)
+            if last_used is not None and now - last_used < _POOL_WARM_SECONDS:
+                return False
+            _POOL_LAST_USED[base_url] = now
+            return True
+
+    def _warmup(self) -> None:
+        """Issue a lightweight request so a pooled connection is open before the first call."""
+        try:
+            self.client.models.retrieve(self.model, timeout=10)
+        except Exception as e:
+            # Any response (even 404) leaves the connection warm; errors are irrelevant here
+            logger.debug(f"LLM connection warmup for {self.base_url} ended with {type(e).__name__}: {e}")
+
+    @staticmethod
+    def _sanitize_content_item(item: Any) -> Any:
+        """Return a log-safe version of one content part; non-image parts are returned as-is."""
+        if not isinstance(item, dict):
+            return item
+        
+        # Handle OpenAI/Azure/Gemini style: image_url
+        if item.get("type") == "image_url":
+            image_url = item.get("image_url")
+            if isinstance(image_url, dict) and image_url.get("url", "").startswith("data:image"):
+                return {**item, "image_url": {**image_url, "url": "<base64_image_data_omitted>"}}
+        
+        # Handle Anthropic style: image with source
+        elif item.get("type") == "image":
+            source = item.get("source")
+            if isinstance(source, dict) and source.get("type") == "base64":
+                return {**item, "source": {**source, "data": "<base64_image_data_omitted>"}}
+        
+        return item
+
     def _sanitize_messages_for_logging(self, messages: List[Dict]) -> List[Dict]:
         """
         Replace base64 image data with placeholder text to avoid huge logs.
         
+        Only the containers on the path to an image payload are copied; everything else
+        is shared with the input, so the base64 data itself is never duplicated.
+        
         Args:
             messages: List of message dictionaries
             
         Returns:
             Sanitized copy of messages
         """
-        import copy
-        sanitized = copy.deepcopy(messages)
-        
-        for msg in sanitized:
-            if "content" not in msg:
-                continue
-            
-            content = msg["content"]
-            if not isinstance(content, list):
-                continue
-            
-            for item in content:
-                if not isinstance(item, dict):
-                    continue
-                
-                # Handle OpenAI/Azure/Gemini style: image_url
-                if item.get("type") == "image_url":
-                    if "image_url" in item and isinstance(item["image_url"], dict):
-                        url = item["image_url"].get("url", "")
-                        if url.startswith("data:image"):
-                            item["image_url"]["url"] = "<base64_image_data_omitted>"
-                
-                # Handle Anthropic style: image with source
-                elif item.get("type") == "image":
-                    if "source" in item and isinstance(item["source"], dict):
-                        if item["source"].get("type") == "base64":
-                            item["source"]["data"] = "<base64_image_data_omitted>"
-        
+        sanitized = []
+        for msg in messages:
+            content = msg.get("content") if isinstance(msg, dict) else None
+            if isinstance(content, list):
+                msg = {**msg, "content": [self._sanitize_content_item(item) for item in content]}
+            sanitized.append(msg)
         return sanitized
 
     def _sanitize_api_params_for_logging(self, api_params: Dict[str, Any]) -> Dict[str, Any]:
-        """Return a safe copy of api_params for logging."""
-        import copy
-        sanitized = copy.deepcopy(api_params)
+        """Return a safe shallow copy of api_params for logging."""
+        sanitized = dict(api_params)
 
-        if "messages" in sanitized:
-            sanitized["messages"] = self._sanitize_messages_for_logging(sanitized["messages"])
+        for key in ("messages", "input"):
+            if isinstance(sanitized.get(key), list):
+                sanitized[key] = self._sanitize_messages_for_logging(sanitized[key])
 
         # Remove/replace sensitive fields if present in kwargs.
         for key in ("api_key", "apiKey", "authorization", "Authorization"):
@@ -157,10 +300,46 @@ class LLMCallManager:
 
         return sanitized
 
+    def _cache_key(
+        self,
+        messages: List[Dict[str, Any]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        kwargs: Dict[str, Any]
+    ) -> Optional[str]:
+        """Return the response-cache key for a request, or None if it must not be cached."""
+        if not self.enable_cache or temperature not in (None, 0):
+            return None
+        payload = json.dumps(
+            {"m": self.model, "msgs": messages, "t": temperature, "mx": max_tokens, "kw": kwargs},
+            sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _store_cached_result(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a deep copy of a call result in the LRU response cache."""
+        stored = copy.deepcopy(result)
+        with self._cache_lock:
+            self._cache[key] = stored
+            if len(self._cache) > self.cache_max_entries:
+                self._cache.popitem(last=False)
+
+    def _lookup_cached_result(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return a deep copy of a cached call result, or None on a miss."""
+        if key is None:
+            return None
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                return None
+            self._cache.move_to_end(key)
+        return copy.deepcopy(cached)
+
     def _extract_responses_content(self, response_data: Dict[str, Any]) -> Dict[str, Optional[str]]:
         content = response_data.get("output_text")
         if content is None:
-            content = ""
+            # Collect the text parts and join once; += is quadratic on long outputs
+            parts = []
             output = response_data.get("output")
             if isinstance(output, list):
                 for item in output:
@@ -170,61 +349,80 @@ class LLMCallManager:
                         if isinstance(part, dict) and part.get("type") in ("output_text", "text"):
                             text_val = part.get("text")
                             if isinstance(text_val, str):
-                                content += text_val
+                                parts.append(text_val)
+            content = "".join(parts)
         return {"content": content, "reasoning_content": None}
 
     def _model_name_lower(self) -> str:
         return (self.model or "").lower()
 
     def _is_gemini_model(self) -> bool:
-        return "gemini" in self._model_name_lower()
+        return self._is_gemini
 
     def _is_claude_model(self) -> bool:
-        return "claude" in self._model_name_lower()
+        return self._is_claude
 
     def _use_responses_for_model(self) -> bool:
-        model_name = self._model_name_lower()
-        return any(model_name.startswith(prefix) for prefix in self.RESPONSES_MODEL_PREFIXES)
+        return self._use_responses
 
-    def _apply_thinking_for_chat(self, api_params: Dict[str, Any]) -> Dict[str, Any]:
-        if self._is_gemini_model():
-            extra_body = api_params.get("extra_body") or {}
-            inner = extra_body.get("extra_body") or {}
-            google = inner.get("google") or {}
-            google["thinking_config"] = {
-                "thinking_budget": self.GEMINI_THINKING_MODE,
-                "include_thoughts": True
+    def _build_thinking_extra_body(self) -> Optional[Dict[str, Any]]:
+        """Provider-specific thinking configuration for chat.completions, or None."""
+        if self._is_gemini:
+            return {
+                "extra_body": {
+                    "google": {
+                        "thinking_config": {
+                            "thinking_budget": self.GEMINI_THINKING_MODE,
+                            "include_thoughts": True
+                        }
+                    }
+                }
             }
-            inner["google"] = google
-            extra_body["extra_body"] = inner
-            api_params["extra_body"] = extra_body
-
-        elif self._is_claude_model():
-            extra_body = api_params.get("extra_body") or {}
-            extra_body["thinking"] = {
-                "type": "enabled",
-                "budget_tokens": self.CLAUDE_THINKING_BUDGET_TOKENS
+        if self._is_claude:
+            return {
+                "thinking": {
+                    "type": "enabled",
+                    "budget_tokens": self.CLAUDE_THINKING_BUDGET_TOKENS
+                }
             }
-            api_params["extra_body"] = extra_body
+        return None
+
+    def _apply_thinking_for_chat(self, api_params: Dict[str, Any]) -> Dict[str, Any]:
+        thinking = self._thinking_extra_body
+        if thinking is None:
+            return api_params
+
+        extra_body = api_params.get("extra_body")
+        if not extra_body:
+            # Shared, never mutated: the SDK only reads it
+            api_params["extra_body"] = thinking
+        elif self._is_gemini:
+            # Merge into the caller's nested google config without mutating it
+            inner = dict(extra_body.get("extra_body") or {})
+            inner["google"] = {**(inner.get("google") or {}), **thinking["extra_body"]["google"]}
+            api_params["extra_body"] = {**extra_body, "extra_body": inner}
+        else:
+            api_params["extra_body"] = {**extra_body, **thinking}
 
         return api_params
     
     def _apply_rate_limit(self):
         """Apply rate limiting if configured."""
-        if self.rate_limit_rpm is None or self.rate_limit_rpm <= 0:
+        if self._rate_limiter is None:
             return
         
-        if self.last_call_time is not None:
-            # Calculate minimum time between requests
-            min_interval = 60.0 / self.rate_limit_rpm
-            elapsed = time.time() - self.last_call_time
-            
-            if elapsed < min_interval:
-                sleep_time = min_interval - elapsed + 3.0  # Add 3s buffer
-                logger.info(
-                    f"Rate limit ({self.rate_limit_rpm} RPM): sleeping {sleep_time:.2f}s"
-                )
-                time.sleep(sleep_time)
+        sleep_time = self._rate_limiter.acquire()
+        if sleep_time > 0:
+            logger.info(
+                f"Rate limit ({self.rate_limit_rpm} RPM): sleeping {sleep_time:.2f}s"
+            )
+            time.sleep(sleep_time)
+    
+    @staticmethod
+    def _is_overload_error(error: Exception) -> bool:
+        """Whether an API error signals rate limiting or server overload (429/5xx)."""
+        status_code = getattr(error, "status_code", None)
+        return isinstance(status_code, int) and (status_code == 429 or status_code >= 500)
     
     def _retry_with_backoff(self, func: Callable, operation_name: str = "LLM call") -> Any:
         """
@@ -244,8 +442,13 @@ class LLMCallManager:
         
         for attempt_idx in range(total_attempts):
             try:
-                return func()
+                result = func()
+                if self._rate_limiter is not None:
+                    self._rate_limiter.increase_rate()
+                return result
             except Exception as e:
+                if self._rate_limiter is not None and self._is_overload_error(e):
+                    self._rate_limiter.decrease_rate()
                 # Last attempt - raise exception
                 if attempt_idx == total_attempts - 1:
                     logger.error(
@@ -298,57 +501,64 @@ class LLMCallManager:
             LLMCallException: If the API call fails after all retries
         """
         # Generate call ID
-        self.call_count += 1
+        call_number = next(self._call_counter)
+        self.call_count = max(self.call_count, call_number)
         if call_id is None:
-            call_id = f"call_{self.session_id}_{self.call_count:04d}"
+            call_id = f"call_{self.session_id}_{call_number:04d}"
+        
+        # Serve identical deterministic requests from the cache
+        cache_key = self._cache_key(messages, temperature, max_tokens, kwargs)
+        cached = self._lookup_cached_result(cache_key)
+        if cached is not None:
+            logger.info(f"LLM call {call_id} served from cache")
+            cached["call_id"] = call_id
+            return cached
         
         # Apply rate limiting
         self._apply_rate_limit()
         
         # Log the call
         logger.info(f"Making LLM call: {call_id}")
-        use_responses_api = self._use_responses_for_model()
+        use_responses_api = self._use_responses
         endpoint = "responses" if use_responses_api else "chat/completions"
         logger.info(
             f"API: {self.base_url}/{endpoint} | model={self.model} | "
             f"timeout={self.timeout}s | messages={len(messages)}"
         )
         
-        # Prepare API call parameters
-        api_params = {
-            "model": self.model,
-            "messages": messages,
-            "timeout": self.timeout,
-            **kwargs
-        }
-        
-        if temperature is not None:
-            api_params["temperature"] = temperature
-        if max_tokens is not None:
-            api_params["max_tokens"] = max_tokens
-
-        # Apply provider-specific thinking configuration for chat.completions
-        if not use_responses_api:
-            api_params = self._apply_thinking_for_chat(api_params)
-
+        # Prepare API call parameters: only the dict for the endpoint actually used is built
+        api_params = None
         responses_params = None
         if use_responses_api and hasattr(self.client, "responses"):
             responses_params = {
                 "model": self.model,
-                "input": api_params.get("messages"),
+                "input": messages,
                 "timeout": self.timeout,
             }
             if self.OPENAI_RESPONSES_REASONING_EFFORT is not None:
                 responses_params["reasoning"] = {"effort": self.OPENAI_RESPONSES_REASONING_EFFORT}
             if self.OPENAI_TEXT_VERBOSITY is not None:
                 responses_params["text"] = {"verbosity": self.OPENAI_TEXT_VERBOSITY}
+        else:
+            api_params = {"model": self.model, "messages": messages, "timeout": self.timeout}
+            if kwargs:
+                api_params.update(kwargs)
+            if temperature is not None:
+                api_params["temperature"] = temperature
+            if max_tokens is not None:
+                api_params["max_tokens"] = max_tokens
+
+            # Apply provider-specific thinking configuration for chat.completions
+            if not use_responses_api:
+                api_params = self._apply_thinking_for_chat(api_params)
 
         # Debug logging: sanitized request params
-        params_for_log = responses_params if responses_params is not None else api_params
-        sanitized_params = self._sanitize_api_params_for_logging(params_for_log)
-        logger.debug(
-            f"Call params for {call_id}: {json.dumps(sanitized_params, indent=2, ensure_ascii=False)}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            params_for_log = responses_params if responses_params is not None else api_params
+            sanitized_params = self._sanitize_api_params_for_logging(params_for_log)
+            logger.debug(
+                f"Call params for {call_id}: {json.dumps(sanitized_params, indent=2, ensure_ascii=False)}"
+            )
         
         # Define the API call function
         def make_api_call():
@@ -360,44 +570,86 @@ class LLMCallManager:
         try:
             response_obj = self._retry_with_backoff(make_api_call, f"LLM call {call_id}")
             self.last_call_time = time.time()
+            _POOL_LAST_USED[self.base_url] = time.monotonic()
             
             # Debug logging: complete original response
-            logger.debug(f"Complete response for {call_id}: {response_obj}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Complete response for {call_id}: {response_obj}")
             
-            # Convert to dict for processing
-            response_data = response_obj.model_dump()
-            
-            # Check for API-level errors
-            if "error" in response_data:
-                error_msg = str(response_data.get("error"))
+            # Check for API-level errors (some providers return them in a 200 body)
+            error = getattr(response_obj, "error", None)
+            if error is not None:
+                error_msg = str(error)
                 logger.error(f"LLM API error in {call_id}: {error_msg}")
                 raise LLMCallException(f"API error: {error_msg}")
             
-            # Extract message content
-            message_obj = response_data.get("choices", [{}])[0].get("message", {})
-            content = message_obj.get("content", "")
-            reasoning_content = message_obj.get("reasoning_content")
-
-            if use_responses_api and "choices" not in response_data:
-                extracted = self._extract_responses_content(response_data)
-                content = extracted.get("content", "")
-                reasoning_content = extracted.get("reasoning_content")
+            # Dump the response once; the message is read from the dumped dict
+            response_data = response_obj.model_dump()
+            choices = response_data.get("choices")
+            if choices:
+                message_obj = choices[0].get("message") or {}
+                content = message_obj.get("content", "")
+                reasoning_content = message_obj.get("reasoning_content")
+            else:
+                message_obj = {}
+                content = ""
+                reasoning_content = None
+                if use_responses_api and choices is None:
+                    extracted = self._extract_responses_content(response_data)
+                    content = extracted.get("content", "")
+                    reasoning_content = extracted.get("reasoning_content")
             
             if content is None:
                 content = reasoning_content  # Fallback if content is None
             
             logger.info(f"LLM call {call_id} completed successfully")
             
-            return {
+            result = {
                 "response_data": response_data,
                 "content": content,
                 "reasoning_content": reasoning_content,
                 "call_id": call_id,
                 "message_object": message_obj
             }
+            if cache_key is not None:
+                self._store_cached_result(cache_key, result)
+            return result
             
         except LLMCallException:
             raise
         except Exception as e:
             logger.error(f"Unexpected error in LLM call {call_id}: {type(e).__name__}: {e}")
             raise LLMCallException(f"Unexpected error in {call_id}") from e
+
+    
+    def call_many(
+        self,
+        batches: List[List[Dict[str, Any]]],
+        concurrency: int = 16,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Make several independent LLM calls concurrently.
+        
+        Each request goes through call(), so retry, rate limiting and caching apply per
+        request; the shared connection pool and rate limiter bound the actual load.
+        
+        Args:
+            batches: List of message lists, one per request
+            concurrency: Maximum number of requests in flight
+            **kwargs: Additional arguments passed to every call() (temperature, max_tokens, ...)
+            
+        Returns:
+            Results in the same order as batches (see call())
+            
+        Raises:
+            LLMCallException: If any request fails after all retries
+        """
+        if not batches:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(batches)))) as executor:
+            futures = [executor.submit(self.call, messages, **kwargs) for messages in batches]
+            return [future.result() for future in futures]
+
+
+atexit.register(LLMCallManager.shutdown_pools)
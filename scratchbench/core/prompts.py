@@ -5,20 +5,8 @@ All prompts are written in English.
 """
 from typing import Optional
 
-
-def system_prompt_primitive(task_description: str, actions_catalog: str) -> str:
-    """
-    Build the system message for primitive mode. This contains the task description,
-    strict response rules, and embeds the Primitive Actions Catalog similar to composite mode.
-    All per-turn UI observations (elements) should be provided via the user prompt.
-    """
-    
-    return f"""You are an AI assistant that controls the Scratch programming environment using primitive UI actions. Your task is: {task_description}
-
-## Primitive Actions Catalog
-{actions_catalog}
-
-## Response Structure Rules
+# Static part of the primitive-mode system prompt, following the actions catalog
+_PRIMITIVE_RULES = """## Response Structure Rules
 
 Every response must follow this two-part structure:
 
@@ -35,7 +23,7 @@ Rules:
 Response format:
 Analysis: <Your thoughts here>
 ```json
-{{"api": "...", "args": {{...}}}}
+{"api": "...", "args": {...}}
 ```
 
 Response examples:
@@ -43,19 +31,19 @@ Response examples:
 Example 1:
 Analysis: I should click the green flag button by index.
 ```json
-{{"api":"click","args":{{"index":3}}}}
+{"api":"click","args":{"index":3}}
 ```
 
 Example 2:
 Analysis: I should type the sprite name into the rename input.
 ```json
-{{"api":"type","args":{{"text":"Sprite1"}}}}
+{"api":"type","args":{"text":"Sprite1"}}
 ```
 
 Example 3:
 Analysis: I have finished the task.
 ```json
-{{"api":"done"}}
+{"api":"done"}
 ```
 
 ## Per-Turn Input
@@ -69,23 +57,8 @@ The element information is provided as a unified list of all visible UI elements
 - position: Location and size as (x, y) width×height in pixels
 """
 
-
-def system_prompt_primitive_withou_element_list(
-    task_description: str, actions_catalog: str
-) -> str:
-    """
-    Build the system message for primitive mode without element list.
-    This contains the task description, strict response rules, and embeds the Primitive Actions Catalog.
-    Only the screenshot is provided as observation. Element list is NOT provided.
-    Index-based actions are NOT allowed.
-    """
-
-    return f"""You are an AI assistant that controls the Scratch programming environment using primitive UI actions. Your task is: {task_description}
-
-## Primitive Actions Catalog
-{actions_catalog}
-
-## Response Structure Rules
+# Static part of the screenshot-only primitive-mode system prompt, following the actions catalog
+_PRIMITIVE_NO_ELEMENTS_RULES = """## Response Structure Rules
 
 Every response must follow this two-part structure:
 
@@ -102,7 +75,7 @@ Rules:
 Response format:
 Analysis: <Your thoughts here>
 ```json
-{{"api": "...", "args": {{...}}}}
+{"api": "...", "args": {...}}
 ```
 
 Response examples:
@@ -110,19 +83,19 @@ Response examples:
 Example 1:
 Analysis: I should click the green flag button.
 ```json
-{{"api":"click","args":{{"x": 300, "y": 400}}}}
+{"api":"click","args":{"x": 300, "y": 400}}
 ```
 
 Example 2:
 Analysis: I should type the sprite name into the rename input.
 ```json
-{{"api":"type","args":{{"text":"Sprite1"}}}}
+{"api":"type","args":{"text":"Sprite1"}}
 ```
 
 Example 3:
 Analysis: I have finished the task.
 ```json
-{{"api":"done"}}
+{"api":"done"}
 ```
 
 ## Per-Turn Input
@@ -130,30 +103,8 @@ Analysis: I have finished the task.
 Each turn, you will receive a screenshot of the current UI.
 """
 
-
-def build_primitive_turn_prompt(elements_info: str) -> str:
-    """
-    Build the minimal per-turn observation prompt that only includes the unified elements list.
-    Other detailed instructions live in the system prompt.
-    """
-    return f"""## Current UI element information:
-{elements_info}
-"""
-
-
-def system_prompt_composite(task_description: str, api_catalog: str, blocks_catalog: str) -> str:
-    """
-    Build the system message for composite mode. This contains the task description,
-    strict response rules, and embeds the Composite API Catalog and the Blocks Catalog
-    so they only appear once at the start of the conversation.
-    """
-
-    return f"""You are an AI assistant that controls the Scratch programming environment using high-level APIs. Your task is: {task_description}
-
-## Composite API Catalog
-{api_catalog}
-
-## Response Structure Rules
+# Static part of the composite-mode system prompt, between the API catalog and the blocks catalog
+_COMPOSITE_RULES = """## Response Structure Rules
 
 Every response must follow this two-part structure:
 
@@ -170,7 +121,7 @@ Rules:
 Response format:
 Analysis: <Your thoughts here>
 ```json
-{{"api": "...", "args": {{...}}}}
+{"api": "...", "args": {...}}
 ```
 
 Response examples:
@@ -178,24 +129,27 @@ Response examples:
 Example 1:
 Analysis: I will connect block 2 to block 1 as the next stack item.
 ```json
-{{"api":"connect_blocks","args":{{"sourceBlockIndex":2,"targetBlockIndex":1,"placement":{{"kind":"stack_after"}}}}}}
+{"api":"connect_blocks","args":{"sourceBlockIndex":2,"targetBlockIndex":1,"placement":{"kind":"stack_after"}}}
 ```
 
 Example 2:
 Analysis: I will switch to the Stage as the current target.
 ```json
-{{"api":"select_stage"}}
+{"api":"select_stage"}
 ```
 
 Example 3:
 Analysis: I will update a field on block index 3.
 ```json
-{{"api":"set_block_field","args":{{"blockIndex":3,"fieldName":"QUESTION","value":"Input:"}}}}
+{"api":"set_block_field","args":{"blockIndex":3,"fieldName":"QUESTION","value":"Input:"}}
 ```
 
 ## Scratch Blocks Catalog
 All available blocks:
-{blocks_catalog.strip()}
+"""
+
+# Static part of the composite-mode system prompt, following the blocks catalog
+_COMPOSITE_PER_TURN_INPUT = """
 
 ## Per-Turn Input
 
@@ -211,6 +165,64 @@ Format notes of blocks pseudocode:
 """
 
 
+def system_prompt_primitive(task_description: str, actions_catalog: str) -> str:
+    """
+    Build the system message for primitive mode. This contains the task description,
+    strict response rules, and embeds the Primitive Actions Catalog similar to composite mode.
+    All per-turn UI observations (elements) should be provided via the user prompt.
+    """
+    
+    return f"""You are an AI assistant that controls the Scratch programming environment using primitive UI actions. Your task is: {task_description}
+
+## Primitive Actions Catalog
+{actions_catalog}
+
+{_PRIMITIVE_RULES}"""
+
+
+def system_prompt_primitive_withou_element_list(
+    task_description: str, actions_catalog: str
+) -> str:
+    """
+    Build the system message for primitive mode without element list.
+    This contains the task description, strict response rules, and embeds the Primitive Actions Catalog.
+    Only the screenshot is provided as observation. Element list is NOT provided.
+    Index-based actions are NOT allowed.
+    """
+
+    return f"""You are an AI assistant that controls the Scratch programming environment using primitive UI actions. Your task is: {task_description}
+
+## Primitive Actions Catalog
+{actions_catalog}
+
+{_PRIMITIVE_NO_ELEMENTS_RULES}"""
+
+
+def build_primitive_turn_prompt(elements_info: str) -> str:
+    """
+    Build the minimal per-turn observation prompt that only includes the unified elements list.
+    Other detailed instructions live in the system prompt.
+    """
+    return f"""## Current UI element information:
+{elements_info}
+"""
+
+
+def system_prompt_composite(task_description: str, api_catalog: str, blocks_catalog: str) -> str:
+    """
+    Build the system message for composite mode. This contains the task description,
+    strict response rules, and embeds the Composite API Catalog and the Blocks Catalog
+    so they only appear once at the start of the conversation.
+    """
+
+    return f"""You are an AI assistant that controls the Scratch programming environment using high-level APIs. Your task is: {task_description}
+
+## Composite API Catalog
+{api_catalog}
+
+{_COMPOSITE_RULES}{blocks_catalog.strip()}{_COMPOSITE_PER_TURN_INPUT}"""
+
+
 def build_composite_turn_prompt(
     pseudocode: str,
     target_name: str,
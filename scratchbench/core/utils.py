@@ -1,7 +1,38 @@
 import json
 import re
+from functools import lru_cache
+from typing import Optional
+
 from json_repair import repair_json
 
+# Missing "y" key in coordinates, e.g. {"x": 156, 304}
+_MISSING_Y_RE = re.compile(r'("x"\s*:\s*-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)')
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)```", re.IGNORECASE | re.DOTALL)
+_FENCE_WITH_LANG_RE = re.compile(r"```(?:.*?)\n(.*?)```", re.DOTALL)
+_FENCE_RE = re.compile(r"```(.*?)```", re.DOTALL)
+_BRACE_RE = re.compile(r"[{}]")
+_JSON_DECODER = json.JSONDecoder()
+
+
+@lru_cache(maxsize=4096)
+def _repair_json_text(raw: str) -> Optional[str]:
+    """Return repaired JSON text for a malformed LLM output, or None if unrepairable.
+
+    Cached because repair_json is slow and LLM outputs repeat across turns; the text
+    (not the parsed object) is cached so every caller gets a fresh, mutable result.
+    """
+    # Heuristic fixes for common LLM errors
+    # Fix 1: Missing "y" key in coordinates, e.g. {"x": 156, 304} -> {"x": 156, "y": 304}
+    # Matches "x": 123, 456 (with optional whitespace)
+    raw = _MISSING_Y_RE.sub(r'\1, "y": \2', raw)
+
+    try:
+        repaired = repair_json(raw)
+        json.loads(repaired)
+        return repaired
+    except Exception:
+        return None
+
 
 def try_parse_json(raw: str):
     raw = raw.strip()
@@ -14,45 +45,28 @@ def try_parse_json(raw: str):
     except Exception:
         pass
 
-    # 2. Heuristic fixes for common LLM errors
-    # Fix 1: Missing "y" key in coordinates, e.g. {"x": 156, 304} -> {"x": 156, "y": 304}
-    # Matches "x": 123, 456 (with optional whitespace)
-    raw = re.sub(r'("x"\s*:\s*-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)', r'\1, "y": \2', raw)
-
-    # 3. Try to repair JSON
-    try:
-        repaired = repair_json(raw)
-        return json.loads(repaired)
-    except Exception:
+    # 2. Apply heuristic fixes and repair the JSON
+    repaired = _repair_json_text(raw)
+    if repaired is None:
         return None
+    return json.loads(repaired)
+
 
 def extract_action_from_llm_content(content: str):
     if not content:
         return None
 
     # 1. 处理 ```json ... ```
-    json_fenced_blocks = re.findall(
-        r"```json\s*(.*?)```",
-        content,
-        flags=re.IGNORECASE | re.DOTALL
-    )
+    json_fenced_blocks = _JSON_FENCE_RE.findall(content)
     if json_fenced_blocks:
         parsed = try_parse_json(json_fenced_blocks[0])
         if parsed is not None:
             return parsed
 
     # 2. 处理 ```...```
-    fenced_blocks = re.findall(
-        r"```(?:.*?)\n(.*?)```",
-        content,
-        flags=re.DOTALL
-    )
+    fenced_blocks = _FENCE_WITH_LANG_RE.findall(content)
     if not fenced_blocks:
-        fenced_blocks = re.findall(
-            r"```(.*?)```",
-            content,
-            flags=re.DOTALL
-        )
+        fenced_blocks = _FENCE_RE.findall(content)
     if fenced_blocks:
         parsed = try_parse_json(fenced_blocks[0])
         if parsed is not None:
@@ -60,25 +74,31 @@ def extract_action_from_llm_content(content: str):
 
     # 3. 处理 { ... }
     stripped = content.strip()
-    brace_objects = []
-    stack = []
+    first_brace = stripped.find('{')
+    if first_brace < 0:
+        return None
+
+    # Fast path: the first object is valid JSON; raw_decode parses it in C and
+    # handles braces inside strings correctly
+    try:
+        return _JSON_DECODER.raw_decode(stripped, first_brace)[0]
+    except ValueError:
+        pass
+
+    # Otherwise repair the first balanced top-level object, so stop scanning once it closes
+    depth = 0
     start_pos = None
-    
-    for i, char in enumerate(stripped):
-        if char == '{':
-            if not stack:
-                start_pos = i
-            stack.append(i)
-        elif char == '}':
-            if stack:
-                stack.pop()
-                if not stack and start_pos is not None:
-                    brace_objects.append(stripped[start_pos:i + 1])
-                    start_pos = None
-    
-    if brace_objects:
-        parsed = try_parse_json(brace_objects[0])
-        if parsed is not None:
-            return parsed
+    for match in _BRACE_RE.finditer(stripped):
+        if match.group() == '{':
+            if depth == 0:
+                start_pos = match.start()
+            depth += 1
+        elif depth:
+            depth -= 1
+            if depth == 0:
+                parsed = try_parse_json(stripped[start_pos:match.end()])
+                if parsed is not None:
+                    return parsed
+                break
 
     return None
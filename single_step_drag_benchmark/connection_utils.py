@@ -3,6 +3,65 @@
 Shared connection verification helpers for RQ1.
 """
 
+
+def _verify_next(target_info, ref_info, target_input_name, target_stack_tail_block_id, variable_name, debug):
+    if debug:
+        print(target_info)
+        print(ref_info)
+    return target_info.get("parent") == ref_info["id"] and ref_info.get("next") == target_info["id"]
+
+
+def _verify_parent(target_info, ref_info, target_input_name, target_stack_tail_block_id, variable_name, debug):
+    tail_id = target_stack_tail_block_id or target_info.get("id")
+    return bool(tail_id) and ref_info.get("parent") == tail_id
+
+
+def _verify_substack(key):
+    def _verify(target_info, ref_info, target_input_name, target_stack_tail_block_id, variable_name, debug):
+        inputs = ref_info.get("inputs", {})
+        if debug:
+            print(inputs)
+            print(target_info["id"])
+        inp = inputs.get(key)
+        return inp is not None and inp.get("block") == target_info["id"]
+    return _verify
+
+
+def _verify_input(target_info, ref_info, target_input_name, target_stack_tail_block_id, variable_name, debug):
+    if variable_name:
+        if target_info.get("opcode") != "data_variable":
+            return False
+        fields = target_info.get("fields", {})
+        variable_field = fields.get("VARIABLE")
+        if isinstance(variable_field, dict):
+            actual_name = variable_field.get("value") or variable_field.get("name")
+        elif isinstance(variable_field, (list, tuple)) and variable_field:
+            actual_name = variable_field[0]
+        elif isinstance(variable_field, str):
+            actual_name = variable_field
+        else:
+            actual_name = None
+        if actual_name != variable_name:
+            return False
+    inputs = ref_info.get("inputs", {})
+    if target_input_name:
+        inp = inputs.get(target_input_name)
+        return bool(inp) and inp.get("block") == target_info["id"]
+    for inp in inputs.values():
+        if inp.get("block") == target_info["id"]:
+            return True
+    return False
+
+
+_HANDLERS = {
+    "next": _verify_next,
+    "parent": _verify_parent,
+    "substack_1": _verify_substack("SUBSTACK"),
+    "substack_2": _verify_substack("SUBSTACK2"),
+    "input": _verify_input,
+}
+
+
 def verify_connection(
     target_info,
     ref_info,
@@ -16,50 +75,10 @@ def verify_connection(
     if not target_info or not ref_info:
         return False
 
-    if connection_type == "next":
-        if debug:
-            print(target_info)
-            print(ref_info)
-        if target_info.get("parent") == ref_info["id"] and ref_info.get("next") == target_info["id"]:
-            return True
-    elif connection_type == "parent":
-        tail_id = target_stack_tail_block_id or target_info.get("id")
-        
-        if tail_id and ref_info.get("parent") == tail_id:
-            return True
-    elif connection_type.startswith("substack"):
-        inputs = ref_info.get("inputs", {})
-        if debug:
-            print(inputs)
-            print(target_info["id"])
-        key = "SUBSTACK" if connection_type == "substack_1" else "SUBSTACK2"
-        if key in inputs:
-            inp = inputs[key]
-            if inp.get("block") == target_info["id"]:
-                return True
-    elif connection_type == "input":
-        if variable_name:
-            if target_info.get("opcode") != "data_variable":
-                return False
-            fields = target_info.get("fields", {})
-            variable_field = fields.get("VARIABLE")
-            if isinstance(variable_field, dict):
-                actual_name = variable_field.get("value") or variable_field.get("name")
-            elif isinstance(variable_field, (list, tuple)) and variable_field:
-                actual_name = variable_field[0]
-            elif isinstance(variable_field, str):
-                actual_name = variable_field
-            else:
-                actual_name = None
-            if actual_name != variable_name:
-                return False
-        inputs = ref_info.get("inputs", {})
-        if target_input_name:
-            inp = inputs.get(target_input_name)
-            if inp and inp.get("block") == target_info["id"]:
-                return True
-        else:
-            for inp in inputs.values():
-                if inp.get("block") == target_info["id"]:
-                    return True
-    return False
+    handler = _HANDLERS.get(connection_type)
+    if handler is None:
+        # Any other "substack*" variant checks the second substack
+        if not connection_type.startswith("substack"):
+            return False
+        handler = _HANDLERS["substack_2"]
+    return handler(target_info, ref_info, target_input_name, target_stack_tail_block_id, variable_name, debug)
@@ -15,9 +15,13 @@ For other models:
 """
 
 import math
+from functools import lru_cache
+from operator import itemgetter
 from typing import Tuple, List, Protocol, Dict, Any
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 # ============================================================================
 # Constants for UI-TARS smart_resize
@@ -28,6 +32,15 @@ MIN_PIXELS = 100 * 28 * 28
 MAX_PIXELS = 16384 * 28 * 28
 MAX_RATIO = 200
 
+# Qwen3-VL outputs coordinates in a 0-1000 normalized space
+QWEN3VL_NORMALIZED_RANGE = 1000
+
+
+@lru_cache(maxsize=16)
+def _coordinate_system_prompt(width: int, height: int) -> str:
+    """Prompt text for a pixel coordinate system, cached per size."""
+    return f"{width}x{height} coordinate system"
+
 
 # ============================================================================
 # Abstract Base Class for Coordinate Resizers
@@ -36,6 +49,8 @@ MAX_RATIO = 200
 class CoordinateResizer(ABC):
     """Abstract base class for coordinate resizers."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def resize(
         self,
@@ -56,6 +71,46 @@ class CoordinateResizer(ABC):
         """
         pass
     
+    def resize_xy(
+        self,
+        x: int,
+        y: int,
+        original_width: int,
+        original_height: int,
+    ) -> Tuple[int, int]:
+        """
+        Scalar variant of resize taking bare x/y, so callers that already hold
+        separate coordinates skip packing and unpacking a tuple.
+        
+        The default implementation delegates to resize; subclasses implement the
+        transform here and have resize delegate to it instead.
+        """
+        return self.resize((x, y), original_width, original_height)
+    
+    def resize_batch(
+        self,
+        coords: np.ndarray,
+        original_width: int,
+        original_height: int,
+    ) -> np.ndarray:
+        """
+        Resize many model output coordinates to actual screen coordinates at once.
+        
+        The default implementation calls resize per point; subclasses override it
+        with a vectorized expression.
+        
+        Args:
+            coords: (N, 2) array of (x, y) coordinates from model output
+            original_width: Original image/screen width
+            original_height: Original image/screen height
+            
+        Returns:
+            (N, 2) integer array of coordinates in actual screen space
+        """
+        coords = np.asarray(coords)
+        resized = [self.resize((x, y), original_width, original_height) for x, y in coords.tolist()]
+        return np.array(resized, dtype=np.int64).reshape(-1, 2)
+    
     @abstractmethod
     def to_model_space(
         self,
@@ -108,9 +163,9 @@ class CoordinateResizer(ABC):
         Returns:
             (start_x, start_y, end_x, end_y) in actual screen space
         """
-        new_start = self.resize((start_x, start_y), original_width, original_height)
-        new_end = self.resize((end_x, end_y), original_width, original_height)
-        return (new_start[0], new_start[1], new_end[0], new_end[1])
+        new_start_x, new_start_y = self.resize_xy(start_x, start_y, original_width, original_height)
+        new_end_x, new_end_y = self.resize_xy(end_x, end_y, original_width, original_height)
+        return (new_start_x, new_start_y, new_end_x, new_end_y)
 
 
 # ============================================================================
@@ -123,6 +178,8 @@ class IdentityResizer(CoordinateResizer):
     Use this for models that output coordinates in actual screen space.
     """
     
+    __slots__ = ()
+    
     def resize(
         self,
         coordinates: Tuple[int, int],
@@ -132,6 +189,25 @@ class IdentityResizer(CoordinateResizer):
         """Return coordinates unchanged."""
         return coordinates
     
+    def resize_xy(
+        self,
+        x: int,
+        y: int,
+        original_width: int,
+        original_height: int,
+    ) -> Tuple[int, int]:
+        """Return coordinates unchanged."""
+        return (x, y)
+    
+    def resize_batch(
+        self,
+        coords: np.ndarray,
+        original_width: int,
+        original_height: int,
+    ) -> np.ndarray:
+        """Return coordinates unchanged."""
+        return np.asarray(coords)
+    
     def to_model_space(
         self,
         coordinates: Tuple[int, int],
@@ -142,13 +218,49 @@ class IdentityResizer(CoordinateResizer):
         return coordinates
         
     def get_coordinate_system_prompt(self, original_width: int, original_height: int) -> str:
-        return f"{original_width}x{original_height} coordinate system"
+        return _coordinate_system_prompt(original_width, original_height)
 
 
 # ============================================================================
 # UI-TARS Resizer (smart_resize based)
 # ============================================================================
 
+def _smart_resize_dims(
+    height: int,
+    width: int,
+    factor: int,
+    min_pixels: int,
+    max_pixels: int,
+) -> Tuple[int, int]:
+    """
+    Arithmetic core of UI-TARS smart_resize for already validated dimensions.
+    
+    A flat function with the round/ceil/floor-by-factor helpers inlined, so the
+    cold path of UITarsResizer.smart_resize makes no method calls.
+    
+    The float sqrt is deliberate: this must reproduce the model's own float-based
+    preprocessing, and an exact integer (math.isqrt) formulation disagrees with it
+    whenever the scaled size lands exactly on a factor boundary (e.g. 1x169).
+    """
+    h_bar = round(height / factor) * factor
+    w_bar = round(width / factor) * factor
+    if h_bar < factor:
+        h_bar = factor
+    if w_bar < factor:
+        w_bar = factor
+    
+    if h_bar * w_bar > max_pixels:
+        beta = math.sqrt((height * width) / max_pixels)
+        h_bar = math.floor(height / beta / factor) * factor
+        w_bar = math.floor(width / beta / factor) * factor
+    elif h_bar * w_bar < min_pixels:
+        beta = math.sqrt(min_pixels / (height * width))
+        h_bar = math.ceil(height * beta / factor) * factor
+        w_bar = math.ceil(width * beta / factor) * factor
+    
+    return h_bar, w_bar
+
+
 class UITarsResizer(CoordinateResizer):
     """
     UI-TARS coordinate resizer.
@@ -164,6 +276,8 @@ class UITarsResizer(CoordinateResizer):
     4. Maintain aspect ratio as closely as possible
     """
     
+    __slots__ = ("factor", "min_pixels", "max_pixels", "max_ratio", "_smart_resize_cache", "_scale_cache")
+    
     def __init__(
         self,
         factor: int = IMAGE_FACTOR,
@@ -175,6 +289,10 @@ class UITarsResizer(CoordinateResizer):
         self.min_pixels = min_pixels
         self.max_pixels = max_pixels
         self.max_ratio = max_ratio
+        # smart_resize results keyed by (height, width); screen sizes rarely change
+        self._smart_resize_cache: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        # Model-space (new_width, new_height) keyed by screen (width, height)
+        self._scale_cache: Dict[Tuple[int, int], Tuple[int, int]] = {}
     
     def _round_by_factor(self, number: float, factor: int) -> int:
         """Returns the closest integer to 'number' that is divisible by 'factor'."""
@@ -201,28 +319,85 @@ class UITarsResizer(CoordinateResizer):
         Returns:
             (new_height, new_width) after smart_resize transformation
         """
+        cached = self._smart_resize_cache.get((height, width))
+        if cached is not None:
+            return cached
+        
         if height <= 0 or width <= 0:
             raise ValueError(f"Invalid dimensions: height={height}, width={width}")
         
-        if max(height, width) / min(height, width) > self.max_ratio:
+        if height >= width:
+            ratio = height / width
+        else:
+            ratio = width / height
+        if ratio > self.max_ratio:
+            raise ValueError(
+                f"Absolute aspect ratio must be smaller than {self.max_ratio}, "
+                f"got {ratio}"
+            )
+        
+        result = _smart_resize_dims(height, width, self.factor, self.min_pixels, self.max_pixels)
+        self._smart_resize_cache[(height, width)] = result
+        return result
+    
+    def smart_resize_batch(self, heights: np.ndarray, widths: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized smart_resize for many image sizes at once (e.g. replaying screenshots).
+        
+        Follows the same float operations as smart_resize, so each result matches
+        the scalar version.
+        
+        Args:
+            heights: (N,) array of original image heights
+            widths: (N,) array of original image widths
+            
+        Returns:
+            (new_heights, new_widths) as (N,) int64 arrays
+        """
+        heights = np.asarray(heights, dtype=np.int64)
+        widths = np.asarray(widths, dtype=np.int64)
+        if np.any(heights <= 0) or np.any(widths <= 0):
+            raise ValueError("Invalid dimensions: all heights and widths must be positive")
+        ratios = np.maximum(heights, widths) / np.minimum(heights, widths)
+        if np.any(ratios > self.max_ratio):
             raise ValueError(
                 f"Absolute aspect ratio must be smaller than {self.max_ratio}, "
-                f"got {max(height, width) / min(height, width)}"
+                f"got {ratios.max()}"
             )
         
-        h_bar = max(self.factor, self._round_by_factor(height, self.factor))
-        w_bar = max(self.factor, self._round_by_factor(width, self.factor))
+        factor = self.factor
+        h_bar = np.maximum(factor, np.round(heights / factor).astype(np.int64) * factor)
+        w_bar = np.maximum(factor, np.round(widths / factor).astype(np.int64) * factor)
+        total = h_bar * w_bar
+        area = heights * widths
+        
+        beta_down = np.sqrt(area / self.max_pixels)
+        h_down = np.floor(heights / beta_down / factor).astype(np.int64) * factor
+        w_down = np.floor(widths / beta_down / factor).astype(np.int64) * factor
         
-        if h_bar * w_bar > self.max_pixels:
-            beta = math.sqrt((height * width) / self.max_pixels)
-            h_bar = self._floor_by_factor(height / beta, self.factor)
-            w_bar = self._floor_by_factor(width / beta, self.factor)
-        elif h_bar * w_bar < self.min_pixels:
-            beta = math.sqrt(self.min_pixels / (height * width))
-            h_bar = self._ceil_by_factor(height * beta, self.factor)
-            w_bar = self._ceil_by_factor(width * beta, self.factor)
+        beta_up = np.sqrt(self.min_pixels / area)
+        h_up = np.ceil(heights * beta_up / factor).astype(np.int64) * factor
+        w_up = np.ceil(widths * beta_up / factor).astype(np.int64) * factor
         
-        return h_bar, w_bar
+        too_big = total > self.max_pixels
+        too_small = total < self.min_pixels
+        new_heights = np.where(too_big, h_down, np.where(too_small, h_up, h_bar))
+        new_widths = np.where(too_big, w_down, np.where(too_small, w_up, w_bar))
+        return new_heights, new_widths
+    
+    def _get_scale(self, original_width: int, original_height: int) -> Tuple[int, int]:
+        """
+        Return the model-space (new_width, new_height) for a screen size.
+        
+        Looked up once per (width, height), so the per-point transforms skip the
+        smart_resize call. The sizes are kept as ints rather than precomputed float
+        ratios so resize/to_model_space keep the original operation order and results.
+        """
+        scale = self._scale_cache.get((original_width, original_height))
+        if scale is None:
+            new_height, new_width = self.smart_resize(original_height, original_width)
+            scale = self._scale_cache[(original_width, original_height)] = (new_width, new_height)
+        return scale
     
     def resize(
         self,
@@ -242,9 +417,18 @@ class UITarsResizer(CoordinateResizer):
             (x, y) coordinates in actual screen space
         """
         model_x, model_y = coordinates
-        
+        return self.resize_xy(model_x, model_y, original_width, original_height)
+    
+    def resize_xy(
+        self,
+        model_x: int,
+        model_y: int,
+        original_width: int,
+        original_height: int,
+    ) -> Tuple[int, int]:
+        """Transform bare x/y from UI-TARS output space to actual screen space."""
         # Get the resized dimensions that the model used
-        new_height, new_width = self.smart_resize(original_height, original_width)
+        new_width, new_height = self._get_scale(original_width, original_height)
         
         # Transform coordinates back to original space
         actual_x = int(model_x / new_width * original_width)
@@ -252,6 +436,40 @@ class UITarsResizer(CoordinateResizer):
         
         return (actual_x, actual_y)
     
+    def resize_drag(
+        self,
+        start_x: int,
+        start_y: int,
+        end_x: int,
+        end_y: int,
+        original_width: int,
+        original_height: int,
+    ) -> Tuple[int, int, int, int]:
+        """Resize both drag endpoints with a single model-space size lookup."""
+        new_width, new_height = self._get_scale(original_width, original_height)
+        return (
+            int(start_x / new_width * original_width),
+            int(start_y / new_height * original_height),
+            int(end_x / new_width * original_width),
+            int(end_y / new_height * original_height),
+        )
+    
+    def resize_batch(
+        self,
+        coords: np.ndarray,
+        original_width: int,
+        original_height: int,
+    ) -> np.ndarray:
+        """
+        Vectorized resize for an (N, 2) array of UI-TARS output coordinates.
+        
+        Uses the same operation order as resize, so results match it point for point.
+        """
+        new_width, new_height = self._get_scale(original_width, original_height)
+        coords = np.asarray(coords, dtype=np.float64)
+        scaled = coords / np.array([new_width, new_height]) * np.array([original_width, original_height])
+        return scaled.astype(np.int64)
+    
     def to_model_space(
         self,
         coordinates: Tuple[int, int],
@@ -264,7 +482,7 @@ class UITarsResizer(CoordinateResizer):
         actual_x, actual_y = coordinates
         
         # Get the resized dimensions that the model used
-        new_height, new_width = self.smart_resize(original_height, original_width)
+        new_width, new_height = self._get_scale(original_width, original_height)
         
         # Transform coordinates to model space
         model_x = int(actual_x / original_width * new_width)
@@ -273,8 +491,8 @@ class UITarsResizer(CoordinateResizer):
         return (model_x, model_y)
 
     def get_coordinate_system_prompt(self, original_width: int, original_height: int) -> str:
-        new_height, new_width = self.smart_resize(original_height, original_width)
-        return f"{new_width}x{new_height} coordinate system"
+        new_width, new_height = self._get_scale(original_width, original_height)
+        return _coordinate_system_prompt(new_width, new_height)
 
 
 # ============================================================================
@@ -295,7 +513,10 @@ class Qwen3VLResizer(CoordinateResizer):
         y_actual = y_model * 0.72
     """
     
-    NORMALIZED_RANGE = 1000  # Qwen3-VL uses 0-1000 coordinate space
+    __slots__ = ()
+    
+    NORMALIZED_RANGE = QWEN3VL_NORMALIZED_RANGE  # Qwen3-VL uses 0-1000 coordinate space
+    COORDINATE_SYSTEM_PROMPT = "0-1000 normalized coordinate system"
     
     def resize(
         self,
@@ -315,13 +536,54 @@ class Qwen3VLResizer(CoordinateResizer):
             (x, y) coordinates in actual screen space
         """
         model_x, model_y = coordinates
-        
+        return self.resize_xy(model_x, model_y, original_width, original_height)
+    
+    def resize_xy(
+        self,
+        model_x: int,
+        model_y: int,
+        original_width: int,
+        original_height: int,
+    ) -> Tuple[int, int]:
+        """Transform bare x/y from Qwen3-VL normalized space (0-1000) to actual screen space."""
         # Scale from 0-1000 normalized space to actual screen dimensions
-        actual_x = int(model_x * original_width / self.NORMALIZED_RANGE)
-        actual_y = int(model_y * original_height / self.NORMALIZED_RANGE)
+        actual_x = int(model_x * original_width / QWEN3VL_NORMALIZED_RANGE)
+        actual_y = int(model_y * original_height / QWEN3VL_NORMALIZED_RANGE)
         
         return (actual_x, actual_y)
     
+    def resize_drag(
+        self,
+        start_x: int,
+        start_y: int,
+        end_x: int,
+        end_y: int,
+        original_width: int,
+        original_height: int,
+    ) -> Tuple[int, int, int, int]:
+        """Resize both drag endpoints without going through resize_xy per point."""
+        return (
+            int(start_x * original_width / QWEN3VL_NORMALIZED_RANGE),
+            int(start_y * original_height / QWEN3VL_NORMALIZED_RANGE),
+            int(end_x * original_width / QWEN3VL_NORMALIZED_RANGE),
+            int(end_y * original_height / QWEN3VL_NORMALIZED_RANGE),
+        )
+    
+    def resize_batch(
+        self,
+        coords: np.ndarray,
+        original_width: int,
+        original_height: int,
+    ) -> np.ndarray:
+        """
+        Vectorized resize for an (N, 2) array of Qwen3-VL normalized coordinates.
+        
+        Uses the same operation order as resize, so results match it point for point.
+        """
+        coords = np.asarray(coords, dtype=np.float64)
+        scaled = coords * np.array([original_width, original_height]) / QWEN3VL_NORMALIZED_RANGE
+        return scaled.astype(np.int64)
+    
     def to_model_space(
         self,
         coordinates: Tuple[int, int],
@@ -334,13 +596,13 @@ class Qwen3VLResizer(CoordinateResizer):
         actual_x, actual_y = coordinates
         
         # Scale from actual screen dimensions to 0-1000 normalized space
-        model_x = int(actual_x * self.NORMALIZED_RANGE / original_width)
-        model_y = int(actual_y * self.NORMALIZED_RANGE / original_height)
+        model_x = int(actual_x * QWEN3VL_NORMALIZED_RANGE / original_width)
+        model_y = int(actual_y * QWEN3VL_NORMALIZED_RANGE / original_height)
         
         return (model_x, model_y)
 
     def get_coordinate_system_prompt(self, original_width: int, original_height: int) -> str:
-        return "0-1000 normalized coordinate system"
+        return self.COORDINATE_SYSTEM_PROMPT
 
 
 # ============================================================================
@@ -364,10 +626,19 @@ QWEN3VL_MODEL_PATTERNS = [
 ]
 
 
+# Shared resizer instances: all use default parameters, so one of each suffices.
+# Construct a resizer explicitly for non-default parameters.
+_IDENTITY_SINGLETON = IdentityResizer()
+_UITARS_SINGLETON = UITarsResizer()
+_QWEN3VL_SINGLETON = Qwen3VLResizer()
+
+
 def get_resizer(model_name: str) -> CoordinateResizer:
     """
     Get the appropriate coordinate resizer for a given model.
     
+    Returns one of the module's shared resizer instances.
+    
     Args:
         model_name: Name of the LLM/VLM model being used
         
@@ -377,17 +648,71 @@ def get_resizer(model_name: str) -> CoordinateResizer:
     model_name_lower = model_name.lower()
     
     # Check if it's a UI-TARS style model
-    for pattern in UITARS_MODEL_PATTERNS:
-        if pattern in model_name_lower:
-            return UITarsResizer()
+    if any(pattern in model_name_lower for pattern in UITARS_MODEL_PATTERNS):
+        return _UITARS_SINGLETON
     
     # Check if it's a Qwen3-VL style model (0-1000 normalized coordinates)
-    for pattern in QWEN3VL_MODEL_PATTERNS:
-        if pattern in model_name_lower:
-            return Qwen3VLResizer()
+    if any(pattern in model_name_lower for pattern in QWEN3VL_MODEL_PATTERNS):
+        return _QWEN3VL_SINGLETON
     
     # Default to identity mapping for unknown models
-    return IdentityResizer()
+    return _IDENTITY_SINGLETON
+
+
+# APIs whose args carry a single (x, y) point or a drag start/end pair
+_SINGLE_POINT_APIS = frozenset({"click", "scroll", "move_to"})
+_DRAG_APIS = frozenset({"drag_and_drop"})
+
+# C-level getters returning a coordinate pair; raise KeyError if either key is missing
+# (TypeError if the model emitted non-dict args)
+_START = itemgetter("start_x", "start_y")
+_END = itemgetter("end_x", "end_y")
+_XY = itemgetter("x", "y")
+
+
+def _resize_drag_args(
+    args: Dict[str, Any],
+    resizer: CoordinateResizer,
+    screen_width: int,
+    screen_height: int,
+) -> None:
+    """Resize the start/end coordinates of drag args in place."""
+    try:
+        start_x, start_y = _START(args)
+        end_x, end_y = _END(args)
+    except (KeyError, TypeError):
+        # Only one endpoint (or none) present: resize whichever is complete
+        if "start_x" in args and "start_y" in args:
+            args["start_x"], args["start_y"] = resizer.resize_xy(*_START(args), screen_width, screen_height)
+        if "end_x" in args and "end_y" in args:
+            args["end_x"], args["end_y"] = resizer.resize_xy(*_END(args), screen_width, screen_height)
+        return
+    
+    # Both endpoints present: one resize_drag call
+    args["start_x"], args["start_y"], args["end_x"], args["end_y"] = resizer.resize_drag(
+        start_x, start_y, end_x, end_y, screen_width, screen_height
+    )
+
+
+def _resize_point_args(
+    args: Dict[str, Any],
+    resizer: CoordinateResizer,
+    screen_width: int,
+    screen_height: int,
+) -> None:
+    """Resize the single (x, y) coordinate of click/scroll/move args in place."""
+    try:
+        point = _XY(args)
+    except (KeyError, TypeError):
+        return
+    args["x"], args["y"] = resizer.resize_xy(*point, screen_width, screen_height)
+
+
+# API name -> in-place args resizer
+_ARGS_RESIZERS = {
+    **dict.fromkeys(_DRAG_APIS, _resize_drag_args),
+    **dict.fromkeys(_SINGLE_POINT_APIS, _resize_point_args),
+}
 
 
 def resize_action_coordinates(
@@ -411,41 +736,15 @@ def resize_action_coordinates(
     if not action_plan or "args" not in action_plan:
         return action_plan
     
+    # Identity models (e.g. GPT-4o, Gemini) already output screen coordinates
     resizer = get_resizer(model_name)
-    args = action_plan["args"]
+    if resizer is _IDENTITY_SINGLETON:
+        return action_plan
     
-    # Check if this is a drag_and_drop action with coordinates
-    if action_plan.get("api") == "drag_and_drop":
-        # Resize start coordinates if present
-        if "start_x" in args and "start_y" in args:
-            new_x, new_y = resizer.resize(
-                (args["start_x"], args["start_y"]),
-                screen_width,
-                screen_height,
-            )
-            args["start_x"] = new_x
-            args["start_y"] = new_y
-        
-        # Resize end coordinates if present
-        if "end_x" in args and "end_y" in args:
-            new_x, new_y = resizer.resize(
-                (args["end_x"], args["end_y"]),
-                screen_width,
-                screen_height,
-            )
-            args["end_x"] = new_x
-            args["end_y"] = new_y
-    
-    # Handle click/scroll actions with single coordinates
-    elif action_plan.get("api") in ["click", "scroll", "move_to"]:
-        if "x" in args and "y" in args:
-            new_x, new_y = resizer.resize(
-                (args["x"], args["y"]),
-                screen_width,
-                screen_height,
-            )
-            args["x"] = new_x
-            args["y"] = new_y
+    api = action_plan.get("api")
+    resize_args = _ARGS_RESIZERS.get(api) if isinstance(api, str) else None
+    if resize_args is not None:
+        resize_args(action_plan["args"], resizer, screen_width, screen_height)
     
     return action_plan
 
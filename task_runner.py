@@ -4,33 +4,46 @@ Main Task Runner
 Coordinates the entire task execution flow: config loading → environment management → agent interaction → evaluation
 """
 
+import atexit
 import json
+import queue
 import sys
+import threading
 import time
 import logging
+import logging.handlers
 from pathlib import Path
 import requests
-import base64
-from typing import Dict, Any, Optional
+import binascii
+from typing import Dict, Any, List, Optional
 import traceback
 import os
 import shutil
 from datetime import datetime
 from dotenv import load_dotenv
-from scratchbench.core.agent_client import ScratchAgentEnvironment
-from scratchbench.core.base_agent import AgentPredictionException
 import copy
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 
-def _safe_join(base: str, route: str) -> str:
-    if not route:
-        return base
-    if route.startswith('/'):
-        return base.rstrip('/') + route
-    return base.rstrip('/') + '/' + route
+# Characters in a model name that are unsafe in file and directory names
+_MODEL_NAME_TRANS = str.maketrans({'/': '_', '\\': '_', '-': '_', ' ': '_'})
 
 def _sanitize_model_name(model_name: str) -> str:
-    return model_name.replace('/', '_').replace('\\', '_').replace("-", "_").replace(" ", "_")
+    return model_name.translate(_MODEL_NAME_TRANS)
+
+
+def _normalize_action_for_log(action_obj: Any) -> Dict[str, Any]:
+    if not isinstance(action_obj, dict):
+        return {"api": "", "args": {}}
+    api = action_obj.get("api")
+    args = action_obj.get("args", {})
+    return {
+        # Interned: the handful of API names repeats across every turn log
+        "api": sys.intern(str(api)) if api is not None else "",
+        "args": dict(args) if isinstance(args, dict) else {},
+    }
 
 
 def _mask_secret_value(value: Any) -> str:
@@ -40,20 +53,131 @@ def _mask_secret_value(value: Any) -> str:
 
 
 def _mask_api_keys_in_dict(value: Any) -> Any:
+    """Mask values of keys containing "api_key", copying only containers on the path to one.
+
+    Subtrees without such keys are returned as-is (by identity) instead of being rebuilt.
+    """
     if isinstance(value, dict):
-        masked: Dict[str, Any] = {}
+        masked: Optional[Dict[Any, Any]] = None
         for k, v in value.items():
             if "api_key" in str(k).lower():
-                masked[k] = _mask_secret_value(v)
+                new_v = _mask_secret_value(v)
+            elif isinstance(v, (dict, list, tuple)):
+                new_v = _mask_api_keys_in_dict(v)
             else:
-                masked[k] = _mask_api_keys_in_dict(v)
-        return masked
-    if isinstance(value, list):
-        return [_mask_api_keys_in_dict(v) for v in value]
-    if isinstance(value, tuple):
-        return tuple(_mask_api_keys_in_dict(v) for v in value)
+                continue
+            if new_v is not v:
+                if masked is None:
+                    masked = dict(value)
+                masked[k] = new_v
+        return value if masked is None else masked
+    if isinstance(value, (list, tuple)):
+        items = [_mask_api_keys_in_dict(v) for v in value]
+        if all(new_v is v for new_v, v in zip(items, value)):
+            return value
+        return items if isinstance(value, list) else tuple(items)
     return value
 
+
+def _write_json(path: Path, obj: Any) -> None:
+    """Write obj as indented UTF-8 JSON.
+
+    The document is serialized in full before the file is opened: json.dump with indent
+    issues one write per token, and a serialization error would leave a truncated file.
+    """
+    path.write_text(json.dumps(obj, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+# Fixed pauses after session creation, after environment setup and after each action
+_SESSION_READY_WAIT = 3.0
+_SETUP_SETTLE_WAIT = 5.0
+_ACTION_SETTLE_WAIT = 2.0
+
+# Base64 characters decoded per write when saving large payloads: 1 MiB of text becomes one
+# 768 KiB write, which bypasses the file buffer. A multiple of 4 so every window decodes on its own
+_B64_WINDOW = 4 * 256 * 1024
+
+
+def _write_base64_file(data_b64: str, path: Path) -> int:
+    """Decode a base64 payload into path window by window; returns the number of bytes written.
+
+    Only one decoded window is alive at a time instead of a full copy of the payload.
+    The API encodes with plain b64encode (no line breaks), so windows stay 4-aligned.
+    """
+    written = 0
+    with open(path, "wb") as f:
+        for start in range(0, len(data_b64), _B64_WINDOW):
+            written += f.write(binascii.a2b_base64(data_b64[start:start + _B64_WINDOW]))
+    return written
+
+
+# Leading bytes of every PNG file
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Longest time (seconds) buffered log output may wait before being written to disk
+_LOG_FLUSH_INTERVAL = 1.0
+
+# Task category subdirectories searched after the tasks_dir root
+_TASK_SUBDIRS = ("create", "debug", "extend", "compute")
+
+
+@lru_cache(maxsize=8)
+def _task_index(tasks_dir: Path) -> Dict[str, Path]:
+    """Map task name -> config path for every *.json in tasks_dir and its category subdirectories.
+
+    Built with one scandir per directory; earlier directories win, matching the search order.
+    """
+    index: Dict[str, Path] = {}
+    for directory in (tasks_dir, *(tasks_dir / dir_name for dir_name in _TASK_SUBDIRS)):
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file():
+                index.setdefault(entry.name[:-5], directory / entry.name)
+    return index
+
+
+def _resolve_task_path(tasks_dir: Path, task_name: str) -> Path:
+    """Find a task config file, supporting search in subdirectories.
+
+    Looks the name up in the cached directory index and only probes the filesystem on a
+    miss (e.g. a file added after the index was built). A hit whose file has since been
+    removed or moved drops the stale index and falls back to probing.
+    """
+    path = _task_index(tasks_dir).get(task_name)
+    if path is not None:
+        if path.is_file():
+            return path
+        _task_index.cache_clear()
+
+    # Try searching task config in different subdirectories; candidates stay plain strings
+    # and only the hit is promoted to a Path
+    root = os.fspath(tasks_dir)
+    file_name = f"{task_name}.json"
+    search_paths = (
+        os.path.join(root, file_name),  # backward-compatible direct path
+        *(os.path.join(root, dir_name, file_name) for dir_name in _TASK_SUBDIRS),
+    )
+
+    for path in search_paths:
+        if os.path.isfile(path):
+            return Path(path)
+
+    searched_paths = "\n".join([f"  - {path}" for path in search_paths])
+    raise FileNotFoundError(f"Task config not found. Searched paths:\n{searched_paths}")
+
+
+@lru_cache(maxsize=512)
+def _read_task_text(path: Path, mtime_ns: int) -> str:
+    """Read a task config file; cached per (path, mtime_ns).
+
+    The text rather than the parsed dict is cached so every caller gets its own config.
+    """
+    return path.read_text(encoding='utf-8')
+
+
 @dataclass(frozen=True)
 class RunConfig:
     task_list: str
@@ -76,7 +200,25 @@ class RunConfig:
 
     agent_configs: Dict[str, Any]
 
-class ColorFormatter(logging.Formatter):
+class _SharedFormatter(logging.Formatter):
+    """Formatter that formats each record once and reuses the text.
+
+    The text is cached on the record under the (fmt, datefmt) pair, so every handler whose
+    formatter uses the same layout -- the four log files and the colored console, which
+    only wraps the text -- shares a single format()/formatTime() call per record.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        key = (self._fmt, self.datefmt)
+        cached = record.__dict__.get("_shared_format")
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        text = super().format(record)
+        record._shared_format = (key, text)
+        return text
+
+
+class ColorFormatter(_SharedFormatter):
     """Custom formatter to add colors to log output for stdout."""
 
     COLORS = {
@@ -94,6 +236,78 @@ class ColorFormatter(logging.Formatter):
         return f"{color}{message}{self.RESET}"
 
 
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler writing through a large buffer instead of flushing every record.
+
+    The buffer is flushed on ERROR+ records, at most flush_interval seconds after the
+    previous flush, when the log listener goes idle and when the handler is closed
+    (listener shutdown / reconfiguration / interpreter exit).
+    """
+
+    def __init__(self, filename: Path, buffer_size: int = 64 * 1024,
+                 flush_interval: float = _LOG_FLUSH_INTERVAL, **kwargs: Any):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        super().__init__(filename, **kwargs)
+
+    def flush(self) -> None:
+        super().flush()
+        self._last_flush = time.monotonic()
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if (record.levelno >= logging.ERROR
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers whenever the queue stays empty for a while.
+
+    Buffered log files are then written out during quiet stretches (e.g. while waiting
+    on the LLM) instead of only once the buffer fills.
+    """
+
+    def dequeue(self, block: bool) -> Any:
+        while True:
+            try:
+                return self.queue.get(block, timeout=_LOG_FLUSH_INTERVAL)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
+
+# Background listener that owns the log file/console handlers (see setup_project_root_logger)
+_LOG_LISTENER: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_log_listener() -> None:
+    """Flush queued records and close the handlers of the current log listener."""
+    global _LOG_LISTENER
+    listener = _LOG_LISTENER
+    if listener is None:
+        return
+    _LOG_LISTENER = None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(_stop_log_listener)
+
+
 def setup_project_root_logger(log_dir: str = "logs", name: Optional[str] = None) -> None:
     """Configure the project ROOT logger with five handlers.
 
@@ -103,6 +317,9 @@ def setup_project_root_logger(log_dir: str = "logs", name: Optional[str] = None)
     - debug.log (DEBUG+, includes all detailed information)
     - error.log (ERROR+)
     - warning.log (WARNING+)
+
+    The handlers are owned by a background QueueListener; the logger itself only
+    gets a QueueHandler, so log calls on worker threads never block on file I/O.
     """
     # Ensure log directory exists
     log_path = Path(log_dir)
@@ -112,11 +329,13 @@ def setup_project_root_logger(log_dir: str = "logs", name: Optional[str] = None)
     root = logging.getLogger(name)
     root.setLevel(logging.DEBUG)
 
-    # Clear existing handlers to avoid duplication in repeated runs
+    # Clear existing handlers to avoid duplication in repeated runs,
+    # flushing and closing the files of a previous configuration
     root.handlers.clear()
+    _stop_log_listener()
 
-    # Common formatter (no colors, for file logs)
-    file_formatter = logging.Formatter(
+    # Common formatter (no colors, for file logs), shared so each record is formatted once
+    file_formatter = _SharedFormatter(
         '%(asctime)s [%(threadName)s] %(name)s %(levelname)s %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
@@ -131,35 +350,42 @@ def setup_project_root_logger(log_dir: str = "logs", name: Optional[str] = None)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(color_formatter)
-    root.addHandler(console_handler)
 
     # main.log handler (INFO+)
     main_file = log_path / 'main.log'
-    main_handler = logging.FileHandler(main_file, encoding='utf-8')
+    main_handler = _BufferedFileHandler(main_file, encoding='utf-8')
     main_handler.setLevel(logging.INFO)
     main_handler.setFormatter(file_formatter)
-    root.addHandler(main_handler)
 
     # debug.log handler (DEBUG+, includes all detailed information)
     debug_file = log_path / 'debug.log'
-    debug_handler = logging.FileHandler(debug_file, encoding='utf-8')
+    debug_handler = _BufferedFileHandler(debug_file, encoding='utf-8')
     debug_handler.setLevel(logging.DEBUG)
     debug_handler.setFormatter(file_formatter)
-    root.addHandler(debug_handler)
 
     # error.log handler (ERROR+)
     error_file = log_path / 'error.log'
-    error_handler = logging.FileHandler(error_file, encoding='utf-8')
+    error_handler = _BufferedFileHandler(error_file, encoding='utf-8')
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(file_formatter)
-    root.addHandler(error_handler)
 
     # warning.log handler (WARNING+)
     warning_file = log_path / 'warning.log'
-    warning_handler = logging.FileHandler(warning_file, encoding='utf-8')
+    warning_handler = _BufferedFileHandler(warning_file, encoding='utf-8')
     warning_handler.setLevel(logging.WARNING)
     warning_handler.setFormatter(file_formatter)
-    root.addHandler(warning_handler)
+
+    # Log calls only enqueue the record; the listener thread does the formatting and I/O.
+    # SimpleQueue is unbounded and lock-free in C, so a put() never contends with the listener
+    global _LOG_LISTENER
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _LOG_LISTENER = _FlushingQueueListener(
+        log_queue,
+        console_handler, main_handler, debug_handler, error_handler, warning_handler,
+        respect_handler_level=True,
+    )
+    _LOG_LISTENER.start()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
 
 # Initialize ROOT logging once (writes to ./logs initially, will be reconfigured in main())
 setup_project_root_logger(log_dir="logs", name="scratch_bench")
@@ -173,16 +399,22 @@ class TaskRunner:
         *,
         run_config: RunConfig,
         result_dir: Path,
+        http_session: Optional[requests.Session] = None,
     ):
         """Initialize the task runner
         
         Args:
             run_config: Fully resolved run configuration (CLI + env), created in main().
             result_dir: Directory to save task results
+            http_session: HTTP session to reuse pooled connections across runners on the
+                same thread (requests.Session is not thread-safe); a private one is created
+                (and closed after run_task) when omitted
         """
         # FastAPI service address - currently points to the scratch-gui container
         self.run_config = run_config
         self.api_url = run_config.api_url
+        # Stripped once here rather than on every _url() call
+        self._api_base = self.api_url.rstrip('/')
         self.tasks_dir = Path(run_config.tasks_dir)
         self.result_dir = result_dir
         self.cost_file = Path("cost.json")
@@ -190,6 +422,8 @@ class TaskRunner:
         self.current_recording_id: Optional[str] = None
         # Track last agent interaction metadata to be saved into result.json
         self.last_interaction_meta: Dict[str, Any] = {}
+        # Screenshot directory already created for the current task (see _save_screenshot)
+        self._screenshots_dir: Optional[Path] = None
         # Server-side sessions are always used
         self.session_id: Optional[str] = None
         # Store the last resolved effective parallel worker count (for tests/diagnostics)
@@ -202,6 +436,10 @@ class TaskRunner:
         self.agent_type = run_config.agent
         # Agent configurations are loaded once in main() and carried by run_config
         self.agent_configs = run_config.agent_configs
+        # HTTP session so calls to the API server reuse keep-alive connections;
+        # it is shared with the ScratchAgentEnvironment created for each interaction
+        self._owns_http = http_session is None
+        self._http = requests.Session() if http_session is None else http_session
 
     def _log_prefix(self) -> str:
         """Build a consistent log prefix for runner messages including session id when available."""
@@ -210,26 +448,9 @@ class TaskRunner:
     
     def load_task_config(self, task_name: str) -> Dict[str, Any]:
         """Load a task config file, supporting search in subdirectories"""
-        # Try searching task config in different subdirectories
-        search_paths = [self.tasks_dir / f"{task_name}.json"]  # backward-compatible direct path
-
-        task_dirs = ["create", "debug", "extend", "compute"]
-
-        for dir_name in task_dirs:
-            search_paths.append(self.tasks_dir / dir_name / f"{task_name}.json")
-
-        config_path = None
-        for path in search_paths:
-            if path.exists():
-                config_path = path
-                break
-
-        if not config_path:
-            searched_paths = "\n".join([f"  - {path}" for path in search_paths])
-            raise FileNotFoundError(f"Task config not found. Searched paths:\n{searched_paths}")
-
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config_path = _resolve_task_path(self.tasks_dir, task_name)
+        # The file's mtime is part of the cache key, so edits between runs are picked up
+        config = json.loads(_read_task_text(config_path, config_path.stat().st_mtime_ns))
 
         logger.info(f"Loaded task config: {task_name}")
         logger.info(f"Config file: {config_path}")
@@ -256,10 +477,10 @@ class TaskRunner:
             return False
         logger.info(self._log_prefix() + f"[task={task_name}] Session created: {self.session_id}")
         
-        time.sleep(3)
+        time.sleep(_SESSION_READY_WAIT)
         # Load initial project
         logger.info(self._log_prefix() + f"[task={task_name}] Loading initial project: {config['initial_project']}")
-        response = requests.post(
+        response = self._http.post(
             self._url("/load_project"),
             params={"project_name": config['initial_project']}
         )
@@ -269,7 +490,7 @@ class TaskRunner:
         
         # Toggle stage to small stage for better element visibility
         logger.info(self._log_prefix() + f"[task={task_name}] Toggling stage to small stage")
-        response = requests.post(self._url("/toggle_stage"))
+        response = self._http.post(self._url("/toggle_stage"))
         if response.status_code != 200:
             logger.warning(self._log_prefix() + f"Stage toggle failed: {response.text}")
         
@@ -295,8 +516,7 @@ class TaskRunner:
         """
         # 1) Save a copy of the task config used for this run
         config_path = task_result_dir / "task_config.json"
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(task_config, f, indent=2, ensure_ascii=False)
+        _write_json(config_path, task_config)
 
         # 2) Save masked run config once + task-specific metadata
         cli_args = _mask_api_keys_in_dict(asdict(self.run_config))
@@ -311,8 +531,7 @@ class TaskRunner:
         }
 
         args_path = task_result_dir / "run_args.json"
-        with open(args_path, "w", encoding="utf-8") as f:
-            json.dump(run_args, f, indent=2, ensure_ascii=False)
+        _write_json(args_path, run_args)
 
         logger.info(f"Saved run configuration to: {args_path}")
 
@@ -338,13 +557,19 @@ class TaskRunner:
         agent_config = self.agent_configs.get(self.agent_type, {})
         env_documents_config = agent_config.get("documents", {})
 
+        # Imported here, like the agent classes below, so that startup and task-list
+        # preparation do not pay for the environment client (and numpy via element fusion)
+        from scratchbench.core.agent_client import ScratchAgentEnvironment
+        from scratchbench.core.base_agent import AgentPredictionException
+
         # Create environment here (inject session_id if available)
         env = ScratchAgentEnvironment(
             api_url=self.api_url,
             mode=mode,
             session_id=self.session_id,
             documents_config=env_documents_config,
-            use_element_list=(not self.run_config.disable_element_list)
+            use_element_list=(not self.run_config.disable_element_list),
+            http_session=self._http,
         )
 
         documentation = env.get_documentation()
@@ -381,7 +606,9 @@ class TaskRunner:
             target_kb_path = os.path.join(memory_root_path, memory_folder_name)
             if not os.path.isdir(target_kb_path):
                 if os.path.isdir(source_kb_path):
-                    shutil.copytree(source_kb_path, target_kb_path)
+                    # copyfile already uses os.sendfile on Linux; skipping copy2's per-file
+                    # copystat saves several syscalls per file in the knowledge base
+                    shutil.copytree(source_kb_path, target_kb_path, copy_function=shutil.copyfile)
                 else:
                     logger.warning(
                         "kb_scratch not found at %s; skipping memory copy for %s",
@@ -449,16 +676,6 @@ class TaskRunner:
         # Initialize interaction tracking
         interaction_session_id = getattr(agent, 'session_id', None)
 
-        def _normalize_action_for_log(action_obj: Any) -> Dict[str, Any]:
-            if not isinstance(action_obj, dict):
-                return {"api": "", "args": {}}
-            api = action_obj.get("api")
-            args = action_obj.get("args", {})
-            return {
-                "api": str(api) if api is not None else "",
-                "args": dict(args) if isinstance(args, dict) else {},
-            }
-
         def _build_local_envelope(
             *,
             success: bool,
@@ -468,7 +685,10 @@ class TaskRunner:
             error: Optional[Dict[str, Any]] = None,
         ) -> Dict[str, Any]:
             normalized_requested = _normalize_action_for_log(requested_action)
-            normalized_executed = _normalize_action_for_log(executed_action or requested_action)
+            if not executed_action or executed_action is requested_action:
+                normalized_executed = normalized_requested
+            else:
+                normalized_executed = _normalize_action_for_log(executed_action)
 
             normalized_error = None
             if not success:
@@ -483,7 +703,8 @@ class TaskRunner:
                 "success": bool(success),
                 "requested_action": normalized_requested,
                 "executed_action": normalized_executed,
-                "data": dict(data) if isinstance(data, dict) else {},
+                # Callers in this loop always pass a freshly built dict, so it is used as-is
+                "data": data if isinstance(data, dict) else {},
                 "error": normalized_error,
                 "meta": {
                     "session_id": interaction_session_id,
@@ -507,134 +728,149 @@ class TaskRunner:
         final_reason = None
         abort_interaction = False
         
-        for turn in range(self.max_steps):
-            logger.info(f"===== Turn {turn+1}/{self.max_steps} =====")
+        try:
+            for turn in range(self.max_steps):
+                logger.debug("===== Turn %d/%d =====", turn + 1, self.max_steps)
             
-            # Create current turn log record
-            turn_log = {
-                "turn": turn + 1,
-                "timestamp": datetime.now().isoformat(),
-                "observation": None,
-                "agent_prediction": None,
-                "action": None,
-                "result": None,
-                "screenshot_path": None
-            }
+                # Create current turn log record
+                turn_log = {
+                    "turn": turn + 1,
+                    "timestamp": datetime.now().isoformat(),
+                    "observation": None,
+                    "agent_prediction": None,
+                    "action": None,
+                    "result": None,
+                    "screenshot_path": None
+                }
             
-            try:
-                # 1. Get current environment observation
-                logger.info("Getting environment observation")
-                observation = env.get_observation()
+                try:
+                    # 1. Get current environment observation
+                    logger.debug("Getting environment observation")
+                    observation = env.get_observation()
                 
-                if "error" in observation:
-                    logger.error(f"Failed to get observation: {observation['error']}")
-                    turn_log["result"] = _build_local_envelope(
-                        success=False,
-                        requested_action={"api": "get_observation", "args": {}},
-                        error={
-                            "code": "OBSERVATION_ERROR",
-                            "message": str(observation["error"]),
-                        },
-                    )
-                    turn_log["action"] = turn_log["result"]["executed_action"]
-                    turn_log["error"] = observation["error"]
-                    continue
+                    if "error" in observation:
+                        logger.error(f"Failed to get observation: {observation['error']}")
+                        turn_log["result"] = _build_local_envelope(
+                            success=False,
+                            requested_action={"api": "get_observation", "args": {}},
+                            error={
+                                "code": "OBSERVATION_ERROR",
+                                "message": str(observation["error"]),
+                            },
+                        )
+                        turn_log["action"] = turn_log["result"]["executed_action"]
+                        turn_log["error"] = observation["error"]
+                        continue
                 
-                screenshot_path = self._save_screenshot(observation["screenshot"], turn, task_result_dir)
-                turn_log["screenshot_path"] = screenshot_path
+                    # 2. Get Agent prediction (the LLM round-trip runs in the background
+                    # while the screenshot and observation log are written)
+                    logger.debug("Getting agent prediction")
+                    prediction = agent.predict_async(observation, turn)
                 
-                # Record observation (remove image data to reduce log size)
-                observation_log = observation.copy()
-                if "screenshot" in observation_log:
-                    observation_log["screenshot"] = "<base64_image_data_removed>"
-                turn_log["observation"] = observation_log
+                    screenshot_path = self._save_screenshot(observation["screenshot"], turn, task_result_dir)
+                    turn_log["screenshot_path"] = screenshot_path
                 
-                # 2. Get Agent prediction
-                logger.info("Getting agent prediction")
-                try:
-                    action_plan = agent.predict(observation, turn)
-                except AgentPredictionException as e:
-                    # LLM API call failed - this is a fatal error, terminate the task
-                    logger.error(f"Fatal error: API error occurred: {e}")
-                    turn_log["result"] = _build_local_envelope(
-                        success=False,
-                        requested_action={"api": "predict", "args": {"turn": turn + 1}},
-                        error={
-                            "code": "API_ERROR",
-                            "message": str(e),
-                        },
-                    )
-                    turn_log["action"] = turn_log["result"]["executed_action"]
-                    turn_log["error"] = f"API_ERROR: {str(e)}"
-                    turn_log["fatal"] = True
-                    final_status = "API_ERROR"
-                    final_reason = f"API error: {str(e)}"
-                    abort_interaction = True
-                    break
+                    # Record observation (remove image data to reduce log size). The log gets a
+                    # shallow copy: the agent is still reading the original in the background
+                    # and may keep it after predicting (AWM's observation history does)
+                    observation_log = observation.copy()
+                    if "screenshot" in observation_log:
+                        observation_log["screenshot"] = "<base64_image_data_removed>"
+                    turn_log["observation"] = observation_log
+                
+                    try:
+                        action_plan = prediction.result()
+                        # Drop the runner's reference to the observation. This only frees the
+                        # screenshot if the agent kept no copy: ScratchAgent stores it as a data
+                        # URL in its conversation history unless use_last_screenshot is set, and
+                        # AWMAgent keeps whole observations in its history
+                        del observation
+                    except AgentPredictionException as e:
+                        # LLM API call failed - this is a fatal error, terminate the task
+                        logger.error(f"Fatal error: API error occurred: {e}")
+                        turn_log["result"] = _build_local_envelope(
+                            success=False,
+                            requested_action={"api": "predict", "args": {"turn": turn + 1}},
+                            error={
+                                "code": "API_ERROR",
+                                "message": str(e),
+                            },
+                        )
+                        turn_log["action"] = turn_log["result"]["executed_action"]
+                        turn_log["error"] = f"API_ERROR: {str(e)}"
+                        turn_log["fatal"] = True
+                        final_status = "API_ERROR"
+                        final_reason = f"API error: {str(e)}"
+                        abort_interaction = True
+                        break
                     
-                turn_log["agent_prediction"] = action_plan
+                    turn_log["agent_prediction"] = action_plan
+                
+                    # 3. Check for valid action
+                    if not action_plan:
+                        logger.error("Agent did not return a valid action, skipping this turn")
+                        turn_log["result"] = _build_local_envelope(
+                            success=False,
+                            requested_action={"api": "", "args": {}},
+                            error={
+                                "code": "INVALID_ACTION_PLAN",
+                                "message": "Agent did not return a valid action",
+                            },
+                        )
+                        turn_log["action"] = turn_log["result"]["executed_action"]
+                        turn_log["error"] = "Agent did not return a valid action"
+                        continue
+                
+                    # 4. Check for termination actions
+                    api_type = action_plan.get("api") if isinstance(action_plan, dict) else None
+                    if api_type in ("done", "failed"):
+                        # Do not execute any UI operation; mark final status and stop
+                        reason = action_plan.get("reason") if isinstance(action_plan, dict) else None
+                        terminal_action = {
+                            "api": api_type,
+                            "args": {"reason": reason} if reason is not None else {},
+                        }
+                        result = _build_local_envelope(
+                            success=True,
+                            requested_action=terminal_action,
+                            executed_action=terminal_action,
+                            data={"reason": reason} if reason is not None else {},
+                        )
+                        turn_log["result"] = result
+                        turn_log["action"] = result["executed_action"]
+                        final_status = api_type
+                        final_reason = reason
+                        logger.info(f"===== Interaction terminated by agent with status: {api_type} =====")
+                        break
+                
+                    # 5. Execute the action in environment
+                    logger.debug("Executing action: %s", api_type)
+                    result = env.execute_action_plan(action_plan)
+                    turn_log["result"] = result
                 
-                # 3. Check for valid action
-                if not action_plan:
-                    logger.error("Agent did not return a valid action, skipping this turn")
+                    # 6. Wait a bit for the action to take effect
+                    time.sleep(_ACTION_SETTLE_WAIT)
+                
+                except Exception as e:
+                    logger.error(f"Error in turn {turn+1}: {e}")
+                    requested_action = _normalize_action_for_log(turn_log.get("agent_prediction"))
                     turn_log["result"] = _build_local_envelope(
                         success=False,
-                        requested_action={"api": "", "args": {}},
+                        requested_action=requested_action,
                         error={
-                            "code": "INVALID_ACTION_PLAN",
-                            "message": "Agent did not return a valid action",
+                            "code": "TURN_EXCEPTION",
+                            "message": str(e),
                         },
                     )
                     turn_log["action"] = turn_log["result"]["executed_action"]
-                    turn_log["error"] = "Agent did not return a valid action"
-                    continue
-                
-                # 4. Check for termination actions
-                api_type = action_plan.get("api") if isinstance(action_plan, dict) else None
-                if api_type in ("done", "failed"):
-                    # Do not execute any UI operation; mark final status and stop
-                    reason = action_plan.get("reason") if isinstance(action_plan, dict) else None
-                    terminal_action = {
-                        "api": api_type,
-                        "args": {"reason": reason} if reason is not None else {},
-                    }
-                    result = _build_local_envelope(
-                        success=True,
-                        requested_action=terminal_action,
-                        executed_action=terminal_action,
-                        data={"reason": reason} if reason is not None else {},
-                    )
-                    turn_log["result"] = result
-                    turn_log["action"] = result["executed_action"]
-                    final_status = api_type
-                    final_reason = reason
-                    logger.info(f"===== Interaction terminated by agent with status: {api_type} =====")
-                    break
-                
-                # 5. Execute the action in environment
-                logger.info(f"Executing action: {api_type}")
-                result = env.execute_action_plan(action_plan)
-                turn_log["result"] = result
-                
-                # 6. Wait a bit for the action to take effect
-                time.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Error in turn {turn+1}: {e}")
-                requested_action = _normalize_action_for_log(turn_log.get("agent_prediction"))
-                turn_log["result"] = _build_local_envelope(
-                    success=False,
-                    requested_action=requested_action,
-                    error={
-                        "code": "TURN_EXCEPTION",
-                        "message": str(e),
-                    },
-                )
-                turn_log["action"] = turn_log["result"]["executed_action"]
-                turn_log["error"] = str(e)
-            finally:
-                # Always save turn log
-                interaction_log["interactions"].append(turn_log)
+                    turn_log["error"] = str(e)
+                finally:
+                    # Always save turn log
+                    interaction_log["interactions"].append(turn_log)
+        finally:
+            # Wait for any in-flight prediction and release the worker thread even when
+            # the loop exits on an unexpected exception
+            agent.shutdown_predict_executor()
         
         # Mark completion
         interaction_log["end_time"] = datetime.now().isoformat()
@@ -642,7 +878,7 @@ class TaskRunner:
         interaction_log["final_reason"] = final_reason
         
         # Save interaction log to file
-        self._save_interaction_log(interaction_log, task_result_dir)
+        log_filepath = self._save_interaction_log(interaction_log, task_result_dir)
 
         # Auto-evaluate the agent's performance if it has auto_eval method
         auto_eval_result = None
@@ -652,8 +888,7 @@ class TaskRunner:
             
             # Save auto-evaluation result
             auto_eval_file = task_result_dir / "autoeval.json"
-            with open(auto_eval_file, 'w', encoding='utf-8') as f:
-                json.dump(auto_eval_result, f, indent=2, ensure_ascii=False)
+            _write_json(auto_eval_file, auto_eval_result)
             
             logger.info(f"Auto-evaluation results saved to: {auto_eval_file}")
         
@@ -668,43 +903,43 @@ class TaskRunner:
         
         logger.info("===== Interaction complete =====")
 
-        # Capture steps used and termination info for result.json
+        # Capture steps used and termination info for result.json. The interaction_log itself
+        # (per-turn records, screenshots already replaced by a placeholder) is not kept here;
+        # it lives in the interaction log file only
         steps_used = len(interaction_log["interactions"])
         self.last_interaction_meta = {
             "steps_used": steps_used,
             "final_status": final_status,
             "final_reason": final_reason,
-            "log_file": None,  # TaskRunner manages logs directly
-            "interaction_log": interaction_log,
+            "log_file": str(log_filepath) if log_filepath is not None else None,
             "auto_eval_result": auto_eval_result  # Include auto-eval result in metadata
         }
         logger.info(f"Agent steps used: {steps_used}; final_status={final_status}")
         
         return not abort_interaction
 
-    def _save_interaction_log(self, interaction_log: Dict[str, Any], task_result_dir: Path) -> None:
+    def _save_interaction_log(self, interaction_log: Dict[str, Any], task_result_dir: Path) -> Optional[Path]:
         """
         Save interaction log to JSON file in task result directory
         
         Args:
             interaction_log: Complete interaction log dictionary
             task_result_dir: Directory to save the log file
+            
+        Returns:
+            saved file path, or None if saving failed
         """
         try:
             log_filename = f"interaction_log_{interaction_log.get('session_id', 'unknown')}.json"
             log_filepath = task_result_dir / log_filename
             
-            with open(log_filepath, 'w', encoding='utf-8') as f:
-                json.dump(interaction_log, f, ensure_ascii=False, indent=2)
+            _write_json(log_filepath, interaction_log)
             
             logger.info(f"Interaction log saved to: {log_filepath}")
-            
-            # Also update the last_interaction_meta with the log file path
-            if hasattr(self, 'last_interaction_meta'):
-                self.last_interaction_meta["log_file"] = str(log_filepath)
-                
+            return log_filepath
         except Exception as e:
             logger.warning(f"Failed to save interaction log: {e}")
+            return None
 
     def _save_screenshot(self, base64_image: str, turn: int, task_result_dir: Path, suffix: str = "") -> str:
         """
@@ -720,18 +955,27 @@ class TaskRunner:
             saved file path
         """
         try:
-            from PIL import Image
-            from io import BytesIO
-            
-            image_data = base64.b64decode(base64_image)
-            image = Image.open(BytesIO(image_data))
+            # a2b_base64 reads the ASCII str in place; b64decode would encode a copy first
+            image_data = binascii.a2b_base64(base64_image)
             
             filename = f"turn_{turn+1:03d}{suffix}.png"
             screenshots_dir = task_result_dir / "screenshots"
-            screenshots_dir.mkdir(exist_ok=True)
+            # Created on the first screenshot of a task rather than on every turn
+            if screenshots_dir != self._screenshots_dir:
+                screenshots_dir.mkdir(exist_ok=True)
+                self._screenshots_dir = screenshots_dir
             filepath = screenshots_dir / filename
             
-            image.save(filepath)
+            if image_data.startswith(_PNG_SIGNATURE):
+                # Already PNG: write the decoded bytes as-is instead of re-encoding
+                filepath.write_bytes(image_data)
+            else:
+                from PIL import Image
+                from io import BytesIO
+                
+                # Other formats are normalized to PNG; fast zlib level keeps this cheap
+                with Image.open(BytesIO(image_data)) as image:
+                    image.save(filepath, optimize=False, compress_level=1)
             logger.info(f"Screenshot saved: {filepath}")
             
             return str(filepath)
@@ -757,13 +1001,12 @@ class TaskRunner:
                     b64 = rec.get("data_base64")
                     if b64:
                         try:
-                            raw = base64.b64decode(b64)
                             # Use provided filename or default to timestamp
                             target_path = Path(task_result_dir) / "recording.webm"
-                            target_path.write_bytes(raw)
+                            saved_bytes = _write_base64_file(b64, target_path)
                             rec["saved_to"] = str(target_path)
-                            rec["saved_bytes"] = len(raw)
-                            logger.info(f"Saved recording to: {target_path} ({len(raw)} bytes)")
+                            rec["saved_bytes"] = saved_bytes
+                            logger.info(f"Saved recording to: {target_path} ({saved_bytes} bytes)")
                         except Exception as write_err:
                             logger.warning(f"Failed to save recording file: {write_err}")
         else:
@@ -775,7 +1018,7 @@ class TaskRunner:
         output_filename = f"{task_name}_{int(time.time())}.sb3"
         logger.info(f"Exporting project: {output_filename}")
 
-        response = requests.post(
+        response = self._http.post(
             self._url("/export_project"),
             params={"output_name": output_filename}
         )
@@ -790,12 +1033,11 @@ class TaskRunner:
                 logger.error(f"Project export response missing data_base64: {result}")
                 return None
 
-            raw = base64.b64decode(data_b64)
             target_path = task_result_dir / filename
-            target_path.write_bytes(raw)
-            logger.info(f"Project file saved to: {target_path} ({len(raw)} bytes)")
-            if size is not None and size != len(raw):
-                logger.warning(f"Reported size {size} != written size {len(raw)}")
+            written = _write_base64_file(data_b64, target_path)
+            logger.info(f"Project file saved to: {target_path} ({written} bytes)")
+            if size is not None and size != written:
+                logger.warning(f"Reported size {size} != written size {written}")
 
             return filename
         else:
@@ -807,7 +1049,7 @@ class TaskRunner:
         logger.info("Starting evaluation...")
 
         # Call evaluation via API instead of executing directly on the host
-        response = requests.post(
+        response = self._http.post(
             self._url("/evaluate"),
             json={
                 "task_name": task_name,
@@ -842,8 +1084,7 @@ class TaskRunner:
         # Save detailed JSON result - use error.json for errors, result.json for success
         filename = "error.json" if is_error else "result.json"
         result_file = task_result_dir / filename
-        with open(result_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        _write_json(result_file, result)
 
         logger.info(f"Task result saved to: {task_result_dir} ({filename})")
 
@@ -851,15 +1092,19 @@ class TaskRunner:
     def _url(self, route: str) -> str:
         """Build URL for route. If a session is active, prefix with /sessions/{id}."""
         if self.session_id:
-            return _safe_join(self.api_url, f"/sessions/{self.session_id}{route}")
-        return _safe_join(self.api_url, route)
+            return f"{self._api_base}/sessions/{self.session_id}{route}"
+        if not route:
+            return self.api_url
+        if route.startswith('/'):
+            return self._api_base + route
+        return f"{self._api_base}/{route}"
 
     def create_session(self, options: Optional[Dict[str, Any]] = None) -> bool:
         try:
             # The FastAPI /sessions endpoint expects query parameters (not JSON body)
             # e.g., /sessions?record=true&quality=medium&task_name=...
             # Sending JSON caused 'record' to be ignored, leading to no recording on delete.
-            resp = requests.post(f"{self.api_url}/sessions", params=options or {}, timeout=20)
+            resp = self._http.post(f"{self.api_url}/sessions", params=options or {}, timeout=20)
             if resp.status_code != 200:
                 logger.error(f"/sessions create failed: {resp.status_code} {resp.text}")
                 return False
@@ -878,7 +1123,7 @@ class TaskRunner:
         if not self.session_id:
             return None
         try:
-            resp = requests.delete(f"{self.api_url}/sessions/{self.session_id}", timeout=20)
+            resp = self._http.delete(f"{self.api_url}/sessions/{self.session_id}", timeout=20)
             data = None
             try:
                 data = resp.json()
@@ -917,7 +1162,7 @@ class TaskRunner:
                 self.save_task_result(task_result_dir, result, task_name, is_error=True)
                 return result
             
-            time.sleep(5)
+            time.sleep(_SETUP_SETTLE_WAIT)
 
             if not self.run_agent_interaction(config, task_result_dir):
                 result = {"success": False, "error": "Agent interaction failed", "timestamp": int(time.time())}
@@ -930,7 +1175,7 @@ class TaskRunner:
                     "success": False,
                     "error": self.last_interaction_meta.get("final_reason", "API error occurred"),
                     "timestamp": int(time.time()),
-                    "agent_interaction": copy.deepcopy(self.last_interaction_meta)
+                    "agent_interaction": dict(self.last_interaction_meta)
                 }
                 self.save_task_result(task_result_dir, result, task_name, is_error=True)
                 return result
@@ -955,9 +1200,10 @@ class TaskRunner:
                 "evaluation": evaluation_result,
                 "timestamp": int(time.time())
             }
-            # Include agent interaction metadata (steps used and termination info)
+            # Include agent interaction metadata (steps used and termination info). A shallow
+            # copy suffices: the meta is rebuilt per interaction and never mutated in place
             if self.last_interaction_meta:
-                result["agent_interaction"] = copy.deepcopy(self.last_interaction_meta)
+                result["agent_interaction"] = dict(self.last_interaction_meta)
 
             # 7. Save task result (before shutdown in case shutdown fails)
             self.save_task_result(task_result_dir, result, task_name)
@@ -1023,6 +1269,8 @@ class TaskRunner:
                         self.close_session()
                 except Exception as force_cleanup_error:
                     logger.error(f"Force session cleanup also failed: {force_cleanup_error}")
+            if self._owns_http:
+                self._http.close()
 
 def prepare_task_execution_list(task_list_name: str, result_dir: Path, tasks_dir: str = "tasks") -> Dict[str, list]:
     """Load a task list JSON that must reside under tasks/ directory.
@@ -1050,29 +1298,44 @@ def prepare_task_execution_list(task_list_name: str, result_dir: Path, tasks_dir
     # Skip tasks that already have a result.json
     filtered_task_list: Dict[str, list] = {}
     skipped_counts: Dict[str, int] = {}
+    stale_dirs: list = []
     for task_type, tasks in (task_list or {}).items():
         remaining = []
         skipped = 0
+        # List the type's result directory once; only tasks that already have a directory
+        # need to be probed for result.json (or cleaned), the rest cost no syscalls
+        try:
+            existing_dirs = {entry.name for entry in os.scandir(result_dir / task_type) if entry.is_dir()}
+        except OSError:
+            existing_dirs = set()
         for task_file in tasks:
             # task_file is e.g. "ask_and_echo.json"; convert to task_name for result dir
             task_name = Path(task_file).stem
-            result_file = result_dir / task_type / task_name / 'result.json'
+            if task_name not in existing_dirs:
+                remaining.append(task_file)
+                continue
+
+            task_result_dir = result_dir / task_type / task_name
+            result_file = task_result_dir / 'result.json'
             if result_file.exists():
                 skipped += 1
                 # Do not read the file; only skip based on existence
                 logger.info(f"[skip] Existing result detected for [type={task_type}] [task={task_name}] at {result_file}")
                 continue
             
-            # Clean the task result directory if it exists (for tasks that should not be skipped)
-            task_result_dir = result_dir / task_type / task_name
-            if task_result_dir.exists():
-                shutil.rmtree(task_result_dir)
-                logger.info(f"[clean] Cleaned existing result directory for [type={task_type}] [task={task_name}] at {task_result_dir}")
-            
+            # Clean the task result directory (for tasks that should not be skipped)
+            stale_dirs.append((task_type, task_name, task_result_dir))
             remaining.append(task_file)
         filtered_task_list[task_type] = remaining
         skipped_counts[task_type] = skipped
 
+    # Remove stale result directories concurrently; rmtree is unlink-bound and releases the GIL
+    if stale_dirs:
+        with ThreadPoolExecutor(max_workers=min(8, len(stale_dirs))) as executor:
+            cleaned = executor.map(shutil.rmtree, [task_result_dir for _, _, task_result_dir in stale_dirs])
+            for (task_type, task_name, task_result_dir), _ in zip(stale_dirs, cleaned):
+                logger.info(f"[clean] Cleaned existing result directory for [type={task_type}] [task={task_name}] at {task_result_dir}")
+
     # Logging summary after filtering
     total_before = sum(len(v) for v in (task_list or {}).values())
     total_after = sum(len(v) for v in (filtered_task_list or {}).values())
@@ -1111,23 +1374,35 @@ def run_task_list(run_config: RunConfig) -> None:
     total_tasks = 0
     successful_tasks = 0
     failed_tasks = 0
-    results = {}
 
     requested_workers = max(1, int(run_config.parallel or 1))
     max_sessions = max(1, int(run_config.max_sessions or 1))
     parallel_workers = min(requested_workers, max_sessions)
     logger.info(f"Parallel workers set to {parallel_workers} (requested={requested_workers}, max={max_sessions})")
     
+    # One HTTP session per worker thread (requests.Session is not thread-safe), reused by
+    # every runner on that thread so its pooled connections stay alive across tasks
+    thread_sessions = threading.local()
+    http_sessions: List[requests.Session] = []
+    http_sessions_lock = threading.Lock()
+
+    def _worker_http_session() -> requests.Session:
+        session = getattr(thread_sessions, "session", None)
+        if session is None:
+            session = thread_sessions.session = requests.Session()
+            with http_sessions_lock:
+                http_sessions.append(session)
+        return session
+
     # Helper to spawn a fresh runner per task for isolation when running in parallel
     def _run_with_fresh_runner(task_name: str) -> Dict[str, Any]:
-        runner = TaskRunner(run_config=run_config, result_dir=result_dir)
+        runner = TaskRunner(run_config=run_config, result_dir=result_dir, http_session=_worker_http_session())
         return runner.run_task(task_name)
 
-    # Execute tasks across all types concurrently using a single global executor
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    # Initialize per-type results containers
-    for task_type in all_tasks.keys():
-        results[task_type] = []
+    # Per-type counters, updated as tasks complete; seeded so the summary keeps the task
+    # list's type order and lists types without tasks
+    type_totals = Counter(dict.fromkeys(all_tasks, 0))
+    type_successes = Counter(dict.fromkeys(all_tasks, 0))
 
     # Prepare a flattened list of (task_type, task_name)
     flat_tasks = []
@@ -1141,24 +1416,31 @@ def run_task_list(run_config: RunConfig) -> None:
     logger.info(f"Running {len(flat_tasks)} tasks across all types in parallel with {parallel_workers} workers...")
     futures = {}
 
-    with ThreadPoolExecutor(max_workers=parallel_workers) as executor:
-        for task_type, task_name in flat_tasks:
-            total_tasks += 1
-            logger.info(f"[{total_tasks}] (queued) [type={task_type}] [task={task_name}] queued for parallel execution")
-            fut = executor.submit(_run_with_fresh_runner, task_name)
-            futures[fut] = task_type
-
-        for fut in as_completed(futures):
-            task_type = futures[fut]
-            try:
-                result = fut.result()
-            except Exception as e:
-                result = {"success": False, "error": str(e), "timestamp": int(time.time())}
-            if result.get("success"):
-                successful_tasks += 1
-            else:
-                failed_tasks += 1
-            results[task_type].append(result)
+    try:
+        # Execute tasks across all types concurrently using a single global executor
+        with ThreadPoolExecutor(max_workers=parallel_workers) as executor:
+            for task_type, task_name in flat_tasks:
+                total_tasks += 1
+                logger.info(f"[{total_tasks}] (queued) [type={task_type}] [task={task_name}] queued for parallel execution")
+                fut = executor.submit(_run_with_fresh_runner, task_name)
+                futures[fut] = task_type
+
+            for fut in as_completed(futures):
+                task_type = futures[fut]
+                try:
+                    result = fut.result()
+                except Exception as e:
+                    result = {"success": False, "error": str(e), "timestamp": int(time.time())}
+                # Only the outcome is counted; the full result is already in the task's result.json
+                type_totals[task_type] += 1
+                if result.get("success"):
+                    successful_tasks += 1
+                    type_successes[task_type] += 1
+                else:
+                    failed_tasks += 1
+    finally:
+        for session in http_sessions:
+            session.close()
 
     # Compute success rate
     success_rate = (successful_tasks / total_tasks * 100) if total_tasks > 0 else 0
@@ -1174,15 +1456,18 @@ def run_task_list(run_config: RunConfig) -> None:
 
     # Per-type statistics
     logger.info("Per-type task statistics:")
-    for task_type, type_results in results.items():
-        type_success = sum(1 for r in type_results if r["success"])
-        type_total = len(type_results)
+    for task_type, type_total in type_totals.items():
+        type_success = type_successes[task_type]
         type_rate = (type_success / type_total * 100) if type_total > 0 else 0
         logger.info(f"  {task_type}: {type_success}/{type_total} ({type_rate:.1f}%)")
 
 def main():
     import argparse
 
+    # The log format only uses threadName, so skip collecting process info per record
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     parser = argparse.ArgumentParser(description="Scratch Task Runner")
     parser.add_argument("--task_list", help="Run tasks from list JSON under tasks/ (e.g., all_tasks.json)", required=True)
     parser.add_argument("--no_recording", action="store_true", help="Disable video recording")
@@ -1233,7 +1518,11 @@ def main():
         agent_configs=agent_configs,
     )
 
-    run_task_list(run_config)
+    try:
+        run_task_list(run_config)
+    finally:
+        # Drain queued records and close the log files before returning
+        _stop_log_listener()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Unit tests for the rate limiter used by LLMCallManager."""
+
+import unittest
+
+from scratchbench.core.llm_call_manager import LLMCallManager, _TokenBucket
+
+
+class FakeClock:
+    """Manually advanced replacement for time.monotonic."""
+
+    def __init__(self, now: float = 100.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TokenBucketTest(unittest.TestCase):
+
+    def test_first_call_does_not_wait(self):
+        bucket = _TokenBucket(60, clock=FakeClock())
+        self.assertEqual(bucket.acquire(), 0.0)
+
+    def test_back_to_back_calls_wait_one_interval(self):
+        bucket = _TokenBucket(30, clock=FakeClock())  # one call every 2s
+        bucket.acquire()
+        self.assertAlmostEqual(bucket.acquire(), 2.0)
+
+    def test_concurrent_reservations_queue_up(self):
+        bucket = _TokenBucket(60, clock=FakeClock())
+        waits = [bucket.acquire() for _ in range(3)]
+        self.assertEqual(waits[0], 0.0)
+        self.assertAlmostEqual(waits[1], 1.0)
+        self.assertAlmostEqual(waits[2], 2.0)
+
+    def test_elapsed_time_refills_the_bucket(self):
+        clock = FakeClock()
+        bucket = _TokenBucket(60, clock=clock)
+        bucket.acquire()
+        clock.advance(0.25)
+        self.assertAlmostEqual(bucket.acquire(), 0.75)
+        clock.advance(10.0)
+        self.assertEqual(bucket.acquire(), 0.0)
+
+    def test_buffer_is_added_only_when_waiting(self):
+        bucket = _TokenBucket(60, buffer=3.0, clock=FakeClock())
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertAlmostEqual(bucket.acquire(), 4.0)
+
+    def test_rate_halves_on_overload_down_to_a_tenth(self):
+        bucket = _TokenBucket(60, clock=FakeClock())
+        bucket.decrease_rate()
+        self.assertAlmostEqual(bucket.rate, 0.5)
+        for _ in range(10):
+            bucket.decrease_rate()
+        self.assertAlmostEqual(bucket.rate, bucket.max_rate / 10.0)
+
+    def test_decreased_rate_slows_pacing(self):
+        bucket = _TokenBucket(60, clock=FakeClock())
+        bucket.acquire()
+        bucket.decrease_rate()
+        self.assertAlmostEqual(bucket.acquire(), 2.0)
+
+    def test_rate_recovers_additively_up_to_the_limit(self):
+        bucket = _TokenBucket(60, clock=FakeClock())
+        bucket.decrease_rate()
+        bucket.increase_rate()
+        self.assertAlmostEqual(bucket.rate, 0.6)
+        for _ in range(20):
+            bucket.increase_rate()
+        self.assertAlmostEqual(bucket.rate, bucket.max_rate)
+
+
+class RateLimitConfigTest(unittest.TestCase):
+
+    def _manager(self, **kwargs) -> LLMCallManager:
+        return LLMCallManager(model="gpt-4o", api_key="test", base_url="http://localhost:1/v1", **kwargs)
+
+    def test_keeps_three_second_buffer_by_default(self):
+        manager = self._manager(rate_limit_rpm=60)
+        self.assertEqual(manager._rate_limiter.buffer, 3.0)
+
+    def test_buffer_is_configurable(self):
+        manager = self._manager(rate_limit_rpm=60, rate_limit_buffer=0.0)
+        self.assertEqual(manager._rate_limiter.buffer, 0.0)
+
+    def test_no_limiter_without_rpm(self):
+        manager = self._manager(rate_limit_rpm=0)
+        self.assertIsNone(manager._rate_limiter)
+
+    def test_retry_adapts_rate_to_overload_errors(self):
+        manager = self._manager(rate_limit_rpm=60, max_retries=1, base_delay=0.0, jitter=0.0)
+        bucket = manager._rate_limiter
+        overloaded = Exception("rate limited")
+        overloaded.status_code = 429
+        calls = []
+
+        def flaky():
+            calls.append(bucket.rate)
+            if len(calls) == 1:
+                raise overloaded
+            return "ok"
+
+        self.assertEqual(manager._retry_with_backoff(flaky), "ok")
+        self.assertAlmostEqual(calls[1], 0.5)
+        self.assertAlmostEqual(bucket.rate, 0.6)
+
+
+if __name__ == "__main__":
+    unittest.main()